@@ -0,0 +1,45 @@
+"""Shared event loop for async CLI commands."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run(main: Awaitable[T]) -> T:
+    """Run a coroutine on the process-wide event loop.
+
+    Unlike ``asyncio.run``, the loop is created once and kept open until the
+    process exits, so objects bound to it (Playwright connections, sessions)
+    stay usable across several calls within one process.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_close)
+    return _loop.run_until_complete(main)
+
+
+def _close() -> None:
+    """Cancel leftover tasks and close the shared loop (as ``asyncio.run`` does)."""
+    global _loop
+    loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -0,0 +1,64 @@
+"""Shared helpers for CLI commands."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import sys
+from typing import TYPE_CHECKING, Any, ContextManager, List
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def parse_csv(value: str) -> List[str]:
+    """Split a comma-separated option value, dropping blanks and whitespace."""
+    return [item for item in map(str.strip, value.split(",")) if item]
+
+
+def status(console: Console, message: str) -> ContextManager[Any]:
+    """Show a spinner while the block runs, but only on an interactive terminal.
+
+    When output is piped or captured (CI logs), the spinner's repaint thread
+    would only emit escape codes, so nothing is shown.
+    """
+    if not console.is_terminal:
+        return contextlib.nullcontext()
+    return console.status(message)
+
+
+def print_json(console: Console, data: Any) -> None:
+    """Print data as indented JSON.
+
+    On a terminal the output is highlighted by Rich. When piped, the JSON is
+    written straight to stdout, via orjson if it is installed, skipping Rich's
+    re-parse and highlighting pass.
+    """
+    if console.is_terminal:
+        console.print_json(data=data)
+        return
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits); let json handle them
+            pass
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(encoded)
+            sys.stdout.buffer.flush()
+            return
+
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
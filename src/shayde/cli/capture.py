@@ -4,12 +4,22 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional
 
 import typer
 from rich.console import Console
 
-from shayde.config.loader import load_config
+from shayde.cli._runtime import run
+from shayde.cli._utils import parse_csv, status
+from shayde.core.capture import (
+    CaptureSession,
+    CaptureSpec,
+    generate_filename,
+    resolve_url,
+)
+
+if TYPE_CHECKING:
+    from shayde.config.schema import ViewportConfig
 
 console = Console()
 app = typer.Typer(no_args_is_help=True)
@@ -21,8 +31,7 @@ PlatformOption = Literal["neutral", "mac", "windows"]
 async def _capture_page_via_server(
     url: str,
     output: Optional[Path],
-    width: Optional[int],
-    height: Optional[int],
+    viewport_config: Optional[ViewportConfig],
     full_page: bool,
 ):
     """Capture via Shayde server (faster, uses persistent connection)."""
@@ -44,17 +53,17 @@ async def _capture_page_via_server(
 
     # Viewport
     viewport = None
-    if width or height:
-        viewport = {"width": width or 1920, "height": height or 1080}
-
-    client = ShaydeClient()
-    with console.status("[bold green]Capturing via server..."):
-        result = await client.capture(
-            url=url,
-            output=output_path,
-            viewport=viewport,
-            full_page=full_page,
-        )
+    if viewport_config:
+        viewport = {"width": viewport_config.width, "height": viewport_config.height}
+
+    async with ShaydeClient() as client:
+        with status(console, "[bold green]Capturing via server..."):
+            result = await client.capture(
+                url=url,
+                output=output_path,
+                viewport=viewport,
+                full_page=full_page,
+            )
 
     if result.get("status") == "ok":
         console.print(f"[green]✓[/green] Saved: {result.get('output')}")
@@ -62,6 +71,76 @@ async def _capture_page_via_server(
         console.print(f"[red]✗[/red] Error: {result.get('error')}")
 
 
+async def _capture_batch_via_server(
+    urls: List[str],
+    output_dir: Optional[Path],
+    parallel: int,
+    viewport: Optional[str],
+):
+    """Capture multiple pages via Shayde server (reuses its browser connection)."""
+    from datetime import datetime
+
+    from shayde.config.loader import load_config
+    from shayde.server.client import ShaydeClient
+
+    config = load_config()
+
+    # The server may run in another directory, so send absolute paths
+    output_directory = (output_dir or Path(config.output.directory)).resolve()
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    viewport_name = viewport or config.capture.default_viewport
+    viewport_config = config.viewports.get(viewport_name)
+    viewport_size = None
+    device_scale_factor = None
+    if viewport_config:
+        viewport_size = {"width": viewport_config.width, "height": viewport_config.height}
+        device_scale_factor = viewport_config.device_scale_factor
+    proxy = config.proxy.model_dump(mode="json")
+
+    now = datetime.now()
+    client = ShaydeClient()
+    pending = iter(urls)
+
+    # A fixed pool of workers pulls URLs and prints each result as it lands,
+    # so nothing per-URL is kept once it has been reported
+    async def worker() -> None:
+        for url in pending:
+            full_url = resolve_url(url, config.app.base_url)
+            output_path = output_directory / generate_filename(
+                full_url,
+                viewport_name=viewport_name,
+                pattern=config.output.filename_pattern,
+                date_format=config.output.date_format,
+                time_format=config.output.time_format,
+                now=now,
+            )
+            try:
+                result = await client.capture(
+                    url=full_url,
+                    output=str(output_path),
+                    viewport=viewport_size,
+                    full_page=config.capture.full_page,
+                    wait_until=config.capture.wait_until,
+                    device_scale_factor=device_scale_factor,
+                    wait_after=config.capture.wait_after,
+                    proxy=proxy,
+                )
+            except Exception as e:
+                result = {"error": str(e)}
+
+            if result.get("status") == "ok":
+                console.print(f"[green]✓[/green] {result.get('output')}")
+            else:
+                console.print(f"[red]✗[/red] {url}: {result.get('error')}")
+
+    try:
+        with status(console, f"[bold green]Capturing {len(urls)} pages via server..."):
+            await asyncio.gather(*[worker() for _ in range(max(parallel, 1))])
+    finally:
+        await client.close()
+
+
 @app.command("page")
 def capture_page(
     url: str = typer.Argument(..., help="URL or path to capture"),
@@ -91,12 +170,21 @@ def capture_page(
     ),
 ):
     """Capture a single page screenshot."""
-    asyncio.run(_capture_page(
+    from shayde.config.schema import ViewportConfig
+
+    # Build custom viewport dimensions before the event loop starts
+    viewport_config = None
+    if width or height:
+        viewport_config = ViewportConfig(
+            width=width or 1920,
+            height=height or 1080,
+        )
+
+    run(_capture_page(
         url=url,
         name=name,
         output=output,
-        width=width,
-        height=height,
+        viewport_config=viewport_config,
         viewport=viewport,
         platform=platform,
         full_page=full_page,
@@ -108,46 +196,33 @@ async def _capture_page(
     url: str,
     name: Optional[str],
     output: Optional[Path],
-    width: Optional[int],
-    height: Optional[int],
+    viewport_config: Optional[ViewportConfig],
     viewport: Optional[str],
     platform: Optional[str],
     full_page: bool,
     wait_for: Optional[str],
 ):
     """Async implementation of capture_page."""
-    from shayde.server.client import ShaydeClient
+    from shayde.server.state import server_available
 
     # Check if server is running - use HTTP API for faster execution
-    if ShaydeClient.server_available():
+    if server_available():
         await _capture_page_via_server(
             url=url,
             output=output,
-            width=width,
-            height=height,
+            viewport_config=viewport_config,
             full_page=full_page,
         )
         return
 
     # Fallback to direct Playwright connection
-    from shayde.config.schema import ViewportConfig
-    from shayde.core.capture import CaptureSession
+    from shayde.config.loader import load_config
 
     config = load_config()
 
-    # Handle custom viewport dimensions
-    viewport_config = None
-    if width or height:
-        viewport_config = ViewportConfig(
-            width=width or 1920,
-            height=height or 1080,
-        )
-    elif viewport:
-        # Use named viewport
-        pass  # Will be resolved in CaptureSession
-
+    # Named viewports are resolved in CaptureSession
     platform_label = f" ({platform})" if platform else ""
-    with console.status(f"[bold green]Capturing screenshot{platform_label}..."):
+    with status(console, f"[bold green]Capturing screenshot{platform_label}..."):
         async with CaptureSession(config, platform=platform) as session:
             result = await session.capture(
                 url_or_path=url,
@@ -178,7 +253,7 @@ def capture_batch(
     ),
 ):
     """Capture multiple pages in parallel."""
-    asyncio.run(_capture_batch(
+    run(_capture_batch(
         urls=urls,
         output_dir=output_dir,
         parallel=parallel,
@@ -195,34 +270,40 @@ async def _capture_batch(
     platform: Optional[str],
 ):
     """Async implementation of capture_batch."""
-    import asyncio
-    from shayde.core.capture import CaptureSession
+    from shayde.server.state import server_available
+
+    # The server has no platform font support; use it only without --platform
+    if platform is None and server_available():
+        await _capture_batch_via_server(
+            urls=urls,
+            output_dir=output_dir,
+            parallel=parallel,
+            viewport=viewport,
+        )
+        return
 
-    config = load_config()
+    from shayde.config.loader import load_config
 
-    async with CaptureSession(config, platform=platform) as session:
-        # Create semaphore for parallel limiting
-        semaphore = asyncio.Semaphore(parallel)
-
-        async def capture_with_limit(url: str):
-            async with semaphore:
-                return await session.capture(
-                    url_or_path=url,
-                    viewport=viewport,
-                    output_dir=output_dir,
-                )
+    config = load_config()
 
-        with console.status(f"[bold green]Capturing {len(urls)} pages..."):
-            results = await asyncio.gather(
-                *[capture_with_limit(url) for url in urls],
-                return_exceptions=True,
-            )
+    specs = (
+        CaptureSpec(url_or_path=url, viewport=viewport, output_dir=output_dir)
+        for url in urls
+    )
 
-    for url, result in zip(urls, results):
-        if isinstance(result, Exception):
-            console.print(f"[red]✗[/red] {url}: {result}")
-        else:
-            console.print(f"[green]✓[/green] {result}")
+    # Report each page as soon as it is captured rather than after the slowest
+    async with CaptureSession(config, platform=platform) as session:
+        results = session.capture_iter(specs, max_concurrency=parallel)
+        with status(console, f"[bold green]Capturing {len(urls)} pages..."):
+            try:
+                async for spec, result in results:
+                    if isinstance(result, Exception):
+                        console.print(f"[red]✗[/red] {spec.url_or_path}: {result}")
+                    else:
+                        console.print(f"[green]✓[/green] {result}")
+            finally:
+                # Stop in-flight captures before the session tears down
+                await results.aclose()
 
 
 @app.command("responsive")
@@ -236,7 +317,7 @@ def capture_responsive(
     ),
 ):
     """Capture page at multiple viewport sizes."""
-    asyncio.run(_capture_responsive(
+    run(_capture_responsive(
         url=url,
         name=name,
         viewports=viewports,
@@ -249,33 +330,44 @@ async def _capture_responsive(
     viewports: Optional[str],
 ):
     """Async implementation of capture_responsive."""
-    from shayde.core.capture import CaptureSession
+    from shayde.config.loader import load_config
 
     config = load_config()
 
     # Determine which viewports to use
     if viewports:
-        viewport_names = [v.strip() for v in viewports.split(",")]
+        viewport_names = parse_csv(viewports)
     else:
         viewport_names = list(config.viewports.keys())
 
-    with console.status(f"[bold green]Capturing {len(viewport_names)} viewports..."):
+    unknown = [v for v in viewport_names if v not in config.viewports]
+    if unknown:
+        console.print("\n".join(
+            f"[yellow]Warning:[/yellow] Unknown viewport: {vp_name}" for vp_name in unknown
+        ))
+
+    specs = [
+        CaptureSpec(url_or_path=url, name=name, viewport=vp_name)
+        for vp_name in viewport_names
+        if vp_name in config.viewports
+    ]
+    if not specs:
+        console.print("[red]✗[/red] No valid viewports to capture")
+        raise typer.Exit(1)
+
+    with status(console, f"[bold green]Capturing {len(specs)} viewports..."):
         async with CaptureSession(config) as session:
-            results = []
-            for vp_name in viewport_names:
-                if vp_name not in config.viewports:
-                    console.print(f"[yellow]Warning:[/yellow] Unknown viewport: {vp_name}")
-                    continue
-
-                result = await session.capture(
-                    url_or_path=url,
-                    name=name,
-                    viewport=vp_name,
-                )
-                results.append((vp_name, result))
+            results = await session.capture_many(
+                specs,
+                max_concurrency=min(len(specs), 4),
+                return_exceptions=True,
+            )
 
-    for vp_name, result in results:
-        console.print(f"[green]✓[/green] {vp_name}: {result}")
+    for spec, result in zip(specs, results):
+        if isinstance(result, Exception):
+            console.print(f"[red]✗[/red] {spec.viewport}: {result}")
+        else:
+            console.print(f"[green]✓[/green] {spec.viewport}: {result}")
 
 
 @app.command("auth")
@@ -301,7 +393,7 @@ def capture_auth(
     ),
 ):
     """Capture pages after logging in."""
-    asyncio.run(_capture_auth(
+    run(_capture_auth(
         urls=urls,
         email=email,
         password=password,
@@ -322,13 +414,13 @@ async def _capture_auth(
     output_dir: Optional[Path],
 ):
     """Async implementation of capture_auth."""
-    from shayde.core.capture import CaptureSession
+    from shayde.config.loader import load_config
 
     config = load_config()
 
     async with CaptureSession(config, platform=platform) as session:
         # Login first
-        with console.status("[bold green]Logging in..."):
+        with status(console, "[bold green]Logging in..."):
             success = await session.login(
                 email=email,
                 password=password,
@@ -341,9 +433,8 @@ async def _capture_auth(
 
         console.print("[green]✓[/green] Login successful")
 
-        # Capture pages
-        with console.status(f"[bold green]Capturing {len(urls)} pages..."):
-            results = []
+        # Capture pages, reporting each as it finishes
+        with status(console, f"[bold green]Capturing {len(urls)} pages..."):
             for url in urls:
                 try:
                     result = await session.capture(
@@ -351,15 +442,10 @@ async def _capture_auth(
                         viewport=viewport,
                         output_dir=output_dir,
                     )
-                    results.append((url, result, None))
                 except Exception as e:
-                    results.append((url, None, e))
-
-    for url, result, error in results:
-        if error:
-            console.print(f"[red]✗[/red] {url}: {error}")
-        else:
-            console.print(f"[green]✓[/green] {result}")
+                    console.print(f"[red]✗[/red] {url}: {e}")
+                else:
+                    console.print(f"[green]✓[/green] {result}")
 
 
 @app.command("platforms")
@@ -379,7 +465,7 @@ def capture_platforms(
     ),
 ):
     """Capture page with multiple platform fonts (Mac and Windows)."""
-    asyncio.run(_capture_platforms(
+    run(_capture_platforms(
         url=url,
         name=name,
         output_dir=output_dir,
@@ -396,36 +482,44 @@ async def _capture_platforms(
     platforms: Optional[str],
 ):
     """Async implementation of capture_platforms."""
-    from shayde.core.capture import CaptureSession
+    from shayde.config.loader import load_config
 
     config = load_config()
 
     # Determine which platforms to capture
     if platforms:
-        platform_list = [p.strip() for p in platforms.split(",")]
+        platform_list = parse_csv(platforms)
     else:
         platform_list = ["mac", "windows"]
 
-    results = []
-    for platform in platform_list:
-        console.print(f"[bold blue]Capturing with {platform} fonts...[/bold blue]")
-
-        async with CaptureSession(config, platform=platform) as session:
-            # Generate name with platform suffix
-            capture_name = f"{name}_{platform}" if name else None
+    # One browser serves every platform; fonts differ only by injected CSS
+    specs = [
+        CaptureSpec(
+            url_or_path=url,
+            name=f"{name}_{platform}" if name else None,
+            viewport=viewport,
+            output_dir=output_dir,
+            platform_suffix=platform,
+            platform=platform,
+        )
+        for platform in platform_list
+    ]
+
+    async with CaptureSession(config) as session:
+        with status(console, f"[bold green]Capturing {len(platform_list)} platforms..."):
+            captured = await session.capture_many(
+                specs,
+                max_concurrency=len(specs),
+                return_exceptions=True,
+            )
 
-            try:
-                result = await session.capture(
-                    url_or_path=url,
-                    name=capture_name,
-                    viewport=viewport,
-                    output_dir=output_dir,
-                    platform_suffix=platform,
-                )
-                results.append((platform, result, None))
-                console.print(f"[green]✓[/green] {platform}: {result}")
-            except Exception as e:
-                results.append((platform, None, e))
-                console.print(f"[red]✗[/red] {platform}: {e}")
+    results = []
+    for platform, result in zip(platform_list, captured):
+        if isinstance(result, Exception):
+            results.append((platform, None, result))
+            console.print(f"[red]✗[/red] {platform}: {result}")
+        else:
+            results.append((platform, result, None))
+            console.print(f"[green]✓[/green] {platform}: {result}")
 
     console.print(f"\n[bold]Captured {len([r for r in results if r[2] is None])}/{len(platform_list)} platforms[/bold]")
@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.syntax import Syntax
-from rich.table import Table
-import yaml
 
-from shayde.config.loader import load_config, CONFIG_FILENAMES
-from shayde.config.schema import ShaydeConfig
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from shayde.config.schema import ShaydeConfig
 
-console = Console()
 app = typer.Typer(no_args_is_help=True)
 
+# Commented config written by `shayde config init`
+CONFIG_TEMPLATE_FILE = Path(__file__).parent / "templates" / "config.yaml.tmpl"
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
 
 @app.command("init")
 def config_init(
@@ -28,13 +38,17 @@ def config_init(
     ),
 ):
     """Create a new .shayde.yaml configuration file."""
+    from shayde.config.schema import ShaydeConfig
+
     # Default output path
     if output is None:
         output = Path.cwd() / ".shayde.yaml"
 
     # Check if file exists
     if output.exists() and not force:
-        console.print(f"[yellow]Warning:[/yellow] {output} already exists. Use --force to overwrite.")
+        _console().print(
+            f"[yellow]Warning:[/yellow] {output} already exists. Use --force to overwrite."
+        )
         raise typer.Exit(1)
 
     # Generate default config
@@ -45,92 +59,77 @@ def config_init(
 
     # Write file
     output.write_text(yaml_content)
-    console.print(f"[green]✓[/green] Created: {output}")
+    _console().print(f"[green]✓[/green] Created: {output}")
 
 
 def _generate_config_yaml(config: ShaydeConfig) -> str:
     """Generate YAML config with helpful comments."""
-    return f"""# Shayde Configuration
-# https://github.com/tatun55/shayde
-
-version: 1
-
-# Application URL configuration
-app:
-  # Base URL (auto-detected from .env APP_URL if not specified)
-  base_url: null
-  env_file: .env
-  env_var: APP_URL
-
-# Dev server proxy configuration
-proxy:
-  enabled: true
-  port: {config.proxy.port}
-  # Vite port (auto-detected from public/hot if not specified)
-  vite_port: null
-  websocket: true
-
-# Docker container configuration
-docker:
-  playwright_version: "{config.docker.playwright_version}"
-  container_name: "{config.docker.container_name}"
-  ws_port: {config.docker.ws_port}
-  auto_start: true
-  auto_stop: false
-
-# Screenshot output configuration
-output:
-  directory: "{config.output.directory}"
-  filename_pattern: "{config.output.filename_pattern}"
-  date_format: "{config.output.date_format}"
-  time_format: "{config.output.time_format}"
-
-# Viewport presets
-viewports:
-  mobile:
-    width: 375
-    height: 812
-    device_scale_factor: 2
-  tablet:
-    width: 768
-    height: 1024
-    device_scale_factor: 1
-  desktop:
-    width: 1920
-    height: 1080
-    device_scale_factor: 1
-
-# Default capture settings
-capture:
-  default_viewport: desktop
-  wait_until: networkidle
-  wait_after: 0
-  full_page: false
-
-# Visual regression settings
-regression:
-  baseline_dir: "{config.regression.baseline_dir}"
-  diff_dir: "{config.regression.diff_dir}"
-  threshold: {config.regression.threshold}
-"""
+    from string import Template
+
+    template = Template(CONFIG_TEMPLATE_FILE.read_text(encoding="utf-8"))
+    return template.substitute(
+        proxy_port=config.proxy.port,
+        playwright_version=config.docker.playwright_version,
+        container_name=config.docker.container_name,
+        ws_port=config.docker.ws_port,
+        output_directory=config.output.directory,
+        filename_pattern=config.output.filename_pattern,
+        date_format=config.output.date_format,
+        time_format=config.output.time_format,
+        baseline_dir=config.regression.baseline_dir,
+        diff_dir=config.regression.diff_dir,
+        threshold=config.regression.threshold,
+    )
 
 
 @app.command("show")
 def config_show(
     format: str = typer.Option(
-        "yaml", "--format", "-f", help="Output format (yaml, table)"
+        "yaml", "--format", "-f", help="Output format (yaml, json, table)"
+    ),
+    raw: bool = typer.Option(
+        False, "--raw", help="Show the project config file as written (no merge/validation)"
     ),
 ):
     """Display current configuration."""
+    if raw:
+        from rich.syntax import Syntax
+
+        from shayde.config.loader import find_config_file
+
+        config_file = find_config_file()
+        if config_file is None:
+            _console().print("[yellow]Warning:[/yellow] No config file found")
+            raise typer.Exit(1)
+
+        _console().print(Syntax(config_file.read_text(encoding="utf-8"), "yaml", theme="monokai"))
+        return
+
+    from shayde.config.loader import load_config
+
     config = load_config()
 
-    if format == "yaml":
-        data = config.model_dump()
+    if format == "json":
+        # Serialized by pydantic-core directly; no YAML involved. Only a
+        # terminal needs Rich to re-parse it for highlighting.
+        config_json = config.model_dump_json(indent=2)
+        if _console().is_terminal:
+            _console().print_json(config_json)
+        else:
+            sys.stdout.write(config_json + "\n")
+
+    elif format == "yaml":
+        import yaml
+        from rich.syntax import Syntax
+
+        data = config.model_dump(mode="json")
         yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True)
         syntax = Syntax(yaml_str, "yaml", theme="monokai")
-        console.print(syntax)
+        _console().print(syntax)
 
     elif format == "table":
+        from rich.table import Table
+
         table = Table(title="Shayde Configuration")
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
@@ -143,22 +142,24 @@ def config_show(
         table.add_row("Output Directory", config.output.directory)
         table.add_row("Default Viewport", config.capture.default_viewport)
 
-        console.print(table)
+        _console().print(table)
 
 
 @app.command("validate")
 def config_validate():
     """Validate configuration file."""
+    from shayde.config.loader import load_config
+
     try:
         config = load_config()
-        console.print("[green]✓[/green] Configuration is valid")
+        _console().print("[green]✓[/green] Configuration is valid")
 
         # Show detected values
         if config.app.base_url:
-            console.print(f"  Base URL: {config.app.base_url}")
+            _console().print(f"  Base URL: {config.app.base_url}")
         if config.proxy.vite_port:
-            console.print(f"  Vite Port: {config.proxy.vite_port}")
+            _console().print(f"  Vite Port: {config.proxy.vite_port}")
 
     except Exception as e:
-        console.print(f"[red]✗[/red] Configuration error: {e}")
+        _console().print(f"[red]✗[/red] Configuration error: {e}")
         raise typer.Exit(1)
@@ -2,56 +2,79 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from shayde.config.loader import load_config
-from shayde.docker.manager import DockerManager
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from shayde.docker.manager import DockerManager
 
-console = Console()
 app = typer.Typer(no_args_is_help=True)
 
 
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _get_manager(ctx: typer.Context) -> DockerManager:
+    """Return the DockerManager for this invocation, creating it on first use."""
+    obj = ctx.ensure_object(dict)
+    manager = obj.get("docker_manager")
+    if manager is None:
+        from shayde.config.loader import load_config
+        from shayde.docker.manager import DockerManager
+
+        manager = DockerManager(load_config(obj.get("config_file")))
+        obj["docker_manager"] = manager
+    return manager
+
+
 @app.command("start")
-def docker_start():
+def docker_start(ctx: typer.Context):
     """Start the Playwright Docker container."""
-    config = load_config()
-    manager = DockerManager(config)
+    manager = _get_manager(ctx)
+    config = manager.config
 
-    with console.status("[bold green]Starting container..."):
+    with _console().status("[bold green]Starting container..."):
         success = manager.start()
 
     if success:
-        console.print(f"[green]✓[/green] Container {config.docker.container_name} started")
-        console.print(f"  WebSocket: {manager.get_ws_url()}")
+        _console().print(f"[green]✓[/green] Container {config.docker.container_name} started")
+        _console().print(f"  WebSocket: {manager.get_ws_url()}")
     else:
-        console.print(f"[red]✗[/red] Failed to start container")
+        _console().print(f"[red]✗[/red] Failed to start container")
         raise typer.Exit(1)
 
 
 @app.command("stop")
-def docker_stop():
+def docker_stop(ctx: typer.Context):
     """Stop the Playwright Docker container."""
-    config = load_config()
-    manager = DockerManager(config)
+    manager = _get_manager(ctx)
+    config = manager.config
 
-    with console.status("[bold green]Stopping container..."):
+    with _console().status("[bold green]Stopping container..."):
         success = manager.stop()
 
     if success:
-        console.print(f"[green]✓[/green] Container {config.docker.container_name} stopped")
+        _console().print(f"[green]✓[/green] Container {config.docker.container_name} stopped")
     else:
-        console.print(f"[red]✗[/red] Failed to stop container")
+        _console().print(f"[red]✗[/red] Failed to stop container")
         raise typer.Exit(1)
 
 
 @app.command("status")
-def docker_status():
+def docker_status(ctx: typer.Context):
     """Show Docker container status."""
-    config = load_config()
-    manager = DockerManager(config)
+    from rich.table import Table
 
+    manager = _get_manager(ctx)
     status = manager.get_status()
 
     table = Table(title="Docker Status")
@@ -67,69 +90,75 @@ def docker_status():
     table.add_row("Image Built", "✓ Yes" if status.get("image_built") else "✗ No")
     table.add_row("Font Platform", str(status.get("platform", "neutral")))
 
-    console.print(table)
+    _console().print(table)
 
 
 @app.command("build")
 def docker_build(
+    ctx: typer.Context,
     force: bool = typer.Option(False, "--force", "-f", help="Force rebuild even if image exists"),
 ):
     """Build the Shayde Docker image with fonts."""
-    config = load_config()
-    manager = DockerManager(config)
+    manager = _get_manager(ctx)
+    config = manager.config
 
     if not config.docker.use_custom_image:
-        console.print("[yellow]Custom image disabled in config, using official Playwright image[/yellow]")
+        _console().print(
+            "[yellow]Custom image disabled in config, using official Playwright image[/yellow]"
+        )
         return
 
-    with console.status("[bold green]Building image (this may take a few minutes)..."):
+    with _console().status("[bold green]Building image (this may take a few minutes)..."):
         success = manager.build_image(force=force)
 
     if success:
-        console.print(f"[green]✓[/green] Image built successfully")
-        console.print(f"  Image: {config.docker.image_name}:latest")
+        _console().print(f"[green]✓[/green] Image built successfully")
+        _console().print(f"  Image: {config.docker.image_name}:latest")
     else:
-        console.print(f"[red]✗[/red] Failed to build image")
+        _console().print(f"[red]✗[/red] Failed to build image")
         raise typer.Exit(1)
 
 
 @app.command("logs")
 def docker_logs(
+    ctx: typer.Context,
     tail: int = typer.Option(50, "--tail", "-n", help="Number of lines to show"),
     follow: bool = typer.Option(False, "--follow", "-f", help="Follow log output"),
 ):
     """Show container logs."""
-    config = load_config()
-    manager = DockerManager(config)
+    manager = _get_manager(ctx)
+    config = manager.config
 
     if not manager.is_container_running():
-        console.print(f"[yellow]Warning:[/yellow] Container {config.docker.container_name} is not running")
+        _console().print(
+            f"[yellow]Warning:[/yellow] Container {config.docker.container_name} is not running"
+        )
         raise typer.Exit(1)
 
     if follow:
-        # Use subprocess for follow mode
-        import subprocess
-        subprocess.run([
+        # Replace this process with docker; nothing is left to do afterwards
+        import os
+        os.execvp(manager._docker_bin, [
             manager._docker_bin, "logs", "-f", "--tail", str(tail),
             config.docker.container_name,
         ])
     else:
         logs = manager.get_logs(tail=tail)
-        console.print(logs)
+        _console().print(logs)
 
 
 @app.command("restart")
-def docker_restart():
+def docker_restart(ctx: typer.Context):
     """Restart the Playwright Docker container."""
-    config = load_config()
-    manager = DockerManager(config)
+    manager = _get_manager(ctx)
+    config = manager.config
 
-    with console.status("[bold green]Restarting container..."):
+    with _console().status("[bold green]Restarting container..."):
         manager.stop()
         success = manager.start()
 
     if success:
-        console.print(f"[green]✓[/green] Container {config.docker.container_name} restarted")
+        _console().print(f"[green]✓[/green] Container {config.docker.container_name} restarted")
     else:
-        console.print(f"[red]✗[/red] Failed to restart container")
+        _console().print(f"[red]✗[/red] Failed to restart container")
         raise typer.Exit(1)
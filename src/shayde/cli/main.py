@@ -2,40 +2,89 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 import typer
 from rich.console import Console
-from rich.logging import RichHandler
+from typer.core import TyperGroup
 
 from shayde import __version__
-from shayde.cli import capture, config, docker, scenario, server, test
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-)
 
 console = Console()
 
+# Subcommand groups, imported only when one of them is actually invoked so
+# that `shayde --version` / `shayde --help` do not load Playwright, aiohttp,
+# pydantic models, etc.
+SUBCOMMANDS = {
+    "capture": ("shayde.cli.capture", "Screenshot capture commands"),
+    "config": ("shayde.cli.config", "Configuration management"),
+    "docker": ("shayde.cli.docker", "Docker container management"),
+    "test": ("shayde.cli.test", "Playwright E2E test commands"),
+    "scenario": ("shayde.cli.scenario", "YAML scenario execution commands"),
+    "server": ("shayde.cli.server", "Server management (persistent mode)"),
+}
+
+
+class LazySubcommand(TyperGroup):
+    """Placeholder for a subcommand group that imports its module on first use."""
+
+    def __init__(self, name: str, module: str, help: str):
+        super().__init__(name=name, help=help)
+        self._module = module
+        self._group: Optional[TyperGroup] = None
+
+    def _load(self) -> TyperGroup:
+        if self._group is None:
+            sub_app = importlib.import_module(self._module).app
+            group = typer.main.get_group(sub_app)
+            group.name = self.name
+            group.help = self.help
+            self._group = group
+        return self._group
+
+    def make_context(self, info_name, args, parent=None, **extra: Any):
+        return self._load().make_context(info_name, args, parent=parent, **extra)
+
+    def invoke(self, ctx):
+        return self._load().invoke(ctx)
+
+    def list_commands(self, ctx) -> List[str]:
+        return self._load().list_commands(ctx)
+
+    def get_command(self, ctx, cmd_name: str):
+        return self._load().get_command(ctx, cmd_name)
+
+
+class LazyGroup(TyperGroup):
+    """Root command group with lazily loaded subcommands."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        for name, (module, help) in SUBCOMMANDS.items():
+            self.add_command(LazySubcommand(name, module, help))
+
+
 app = typer.Typer(
     name="shayde",
     help="Docker Playwright E2E testing and screenshot capture CLI",
     add_completion=True,
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
-# Register subcommands
-app.add_typer(capture.app, name="capture", help="Screenshot capture commands")
-app.add_typer(config.app, name="config", help="Configuration management")
-app.add_typer(docker.app, name="docker", help="Docker container management")
-app.add_typer(test.app, name="test", help="Playwright E2E test commands")
-app.add_typer(scenario.app, name="scenario", help="YAML scenario execution commands")
-app.add_typer(server.app, name="server", help="Server management (persistent mode)")
+
+def _setup_logging(verbose: bool) -> None:
+    """Configure Rich logging for the invoked command."""
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
+    )
 
 
 def version_callback(value: bool):
@@ -76,8 +125,7 @@ def main(
     ctx.obj["config_file"] = config_file
     ctx.obj["verbose"] = verbose
 
-    if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    _setup_logging(verbose)
 
 
 if __name__ == "__main__":
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
+
+from shayde.cli._utils import print_json
 
 console = Console()
 app = typer.Typer(no_args_is_help=True)
@@ -22,7 +20,9 @@ app.add_typer(session_app, name="session")
 
 @app.command("parse")
 def parse_scenario(
-    file: Path = typer.Argument(..., help="Path to scenario YAML file", exists=True),
+    files: List[Path] = typer.Argument(
+        ..., help="Path(s) to scenario YAML files", exists=True
+    ),
     validate: bool = typer.Option(
         False, "--validate", "-v", help="Validate scenario structure"
     ),
@@ -31,38 +31,77 @@ def parse_scenario(
     ),
 ):
     """Parse and display scenario structure."""
-    from shayde.core.scenario.parser import ScenarioParser
+    if len(files) == 1:
+        parsed = [_parse_one(files[0], validate)]
+    else:
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        # One CLI start-up for the whole batch; files parse in parallel
+        workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(_parse_one, files, [validate] * len(files)))
+
+    ok = True
+    scenarios = []
+    for path, scenario, error, validation in parsed:
+        if len(files) > 1 and not output_json:
+            console.rule(str(path))
+
+        if error is not None:
+            console.print(f"[red]Error parsing scenario:[/red] {error}")
+            ok = False
+            continue
 
-    parser = ScenarioParser()
+        if validation is not None:
+            is_valid, errors, warnings = validation
 
-    try:
-        scenario = parser.parse(file)
-    except Exception as e:
-        console.print(f"[red]Error parsing scenario:[/red] {e}")
+            if errors:
+                console.print("[red]Validation Errors:[/red]")
+                for err in errors:
+                    console.print(f"  [red]✗[/red] {err}")
+
+            if warnings:
+                console.print("[yellow]Warnings:[/yellow]")
+                for warning in warnings:
+                    console.print(f"  [yellow]![/yellow] {warning}")
+
+            if is_valid:
+                console.print("[green]✓ Scenario is valid[/green]")
+            else:
+                ok = False
+                continue
+
+        if output_json:
+            scenarios.append(scenario.to_dict())
+        else:
+            _print_scenario_summary(scenario)
+
+    if output_json and scenarios:
+        print_json(console, scenarios if len(files) > 1 else scenarios[0])
+
+    if not ok:
         raise typer.Exit(1)
 
-    if validate:
-        is_valid, errors, warnings = parser.validate(scenario)
 
-        if errors:
-            console.print("[red]Validation Errors:[/red]")
-            for error in errors:
-                console.print(f"  [red]✗[/red] {error}")
+def _parse_one(path: Path, validate: bool):
+    """Parse (and optionally validate) one file; also runs in worker processes.
 
-        if warnings:
-            console.print("[yellow]Warnings:[/yellow]")
-            for warning in warnings:
-                console.print(f"  [yellow]![/yellow] {warning}")
+    Returns:
+        Tuple of (path, scenario, error, validation), where scenario is None
+        if parsing failed and validation is the ``validate()`` result or None
+    """
+    from shayde.core.scenario.parser import ScenarioParser
 
-        if is_valid:
-            console.print("[green]✓ Scenario is valid[/green]")
-        else:
-            raise typer.Exit(1)
+    parser = ScenarioParser()
+    try:
+        if not validate:
+            return path, parser.parse(path), None, None
+        scenario, errors, warnings = parser.parse_and_validate(path)
+    except Exception as e:
+        return path, None, str(e), None
 
-    if output_json:
-        console.print_json(json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2))
-    else:
-        _print_scenario_summary(scenario)
+    return path, scenario, None, (not errors, errors, warnings)
 
 
 @app.command("list")
@@ -73,66 +112,91 @@ def list_steps(
     ),
 ):
     """List all steps in scenario."""
+    _, scenario = _parse_or_exit(file, part=part)
+    _print_step_list(scenario, part_filter=part)
+
+
+def _parse_or_exit(file: Path, part: Optional[int] = None):
+    """Parse a scenario file, exiting with an error message on failure."""
     from shayde.core.scenario.parser import ScenarioParser
 
     parser = ScenarioParser()
 
     try:
-        scenario = parser.parse(file)
+        scenario = parser.parse(file, part=part)
     except Exception as e:
         console.print(f"[red]Error parsing scenario:[/red] {e}")
         raise typer.Exit(1)
 
-    _print_step_list(scenario, part_filter=part)
+    return parser, scenario
 
 
 def _print_scenario_summary(scenario) -> None:
     """Print scenario summary."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     # Header
-    console.print()
-    console.print(Panel(
-        f"[bold]{scenario.meta.title}[/bold]\n"
-        f"ID: {scenario.meta.id} | Priority: {scenario.meta.priority.value} | "
-        f"Est. Time: {scenario.meta.estimated_time or '?'}min",
-        title="Scenario",
-        border_style="blue",
-    ))
+    renderables = [
+        Text(),
+        Panel(
+            f"[bold]{scenario.meta.title}[/bold]\n"
+            f"ID: {scenario.meta.id} | Priority: {scenario.meta.priority.value} | "
+            f"Est. Time: {scenario.meta.estimated_time or '?'}min",
+            title="Scenario",
+            border_style="blue",
+        ),
+    ]
+
+    def section(title: str, lines) -> None:
+        renderables.append(Text())
+        renderables.append(console.render_str(f"[bold]{title}:[/bold]"))
+        renderables.extend(console.render_str(line) for line in lines)
 
     # Prerequisites
     if scenario.prerequisites:
-        console.print("\n[bold]Prerequisites:[/bold]")
-        for prereq in scenario.prerequisites:
-            console.print(f"  • {prereq}")
+        section("Prerequisites", (f"  • {prereq}" for prereq in scenario.prerequisites))
 
     # Coverage
     if scenario.coverage:
-        console.print("\n[bold]Coverage:[/bold]")
-        for cov in scenario.coverage:
-            status_icon = "○" if cov.status.value == "complete" else "△"
-            console.print(f"  {status_icon} {cov.name}")
+        section("Coverage", (
+            f"  {'○' if cov.status.value == 'complete' else '△'} {cov.name}"
+            for cov in scenario.coverage
+        ))
 
     # Accounts
     if scenario.accounts:
-        console.print("\n[bold]Accounts:[/bold]")
-        for key, acc in scenario.accounts.items():
-            console.print(f"  [{key}] {acc.email} ({acc.role or 'N/A'})")
+        section("Accounts", (
+            f"  [{key}] {acc.email} ({acc.role or 'N/A'})"
+            for key, acc in scenario.accounts.items()
+        ))
 
     # Summary
-    console.print()
     table = Table(show_header=False, box=None)
     table.add_column("Label", style="dim")
     table.add_column("Value")
     table.add_row("Parts", str(len(scenario.steps)))
     table.add_row("Steps", str(scenario.total_steps))
     table.add_row("Screenshots", str(scenario.total_screenshots))
-    console.print(table)
+    renderables.append(Text())
+    renderables.append(table)
+    console.print(Group(*renderables))
 
 
 def _print_step_list(scenario, part_filter: Optional[int] = None) -> None:
     """Print step list."""
-    console.print()
-    console.print(f"[bold]{scenario.meta.id}:[/bold] {scenario.meta.title}")
-    console.print("━" * 50)
+    from rich.console import Group
+    from rich.text import Text
+
+    # Render all lines in one print call; per-line console.print dominates
+    # the cost of listing large scenarios
+    lines = [
+        Text(),
+        console.render_str(f"[bold]{scenario.meta.id}:[/bold] {scenario.meta.title}"),
+        Text("━" * 50),
+    ]
 
     total_steps = 0
     total_screenshots = 0
@@ -142,43 +206,54 @@ def _print_step_list(scenario, part_filter: Optional[int] = None) -> None:
             continue
 
         account_info = f"(account: {part.account or 'none'})"
-        console.print(f"\n[bold blue]Part {part.part}:[/bold blue] {part.title} [dim]{account_info}[/dim]")
+        lines.append(console.render_str(
+            f"\n[bold blue]Part {part.part}:[/bold blue] {part.title} [dim]{account_info}[/dim]"
+        ))
 
         for step in part.items:
             screenshot_icon = " 📸" if step.has_screenshot else ""
             action_type = _get_action_type(step.action)
             action_hint = f" [dim]({action_type})[/dim]" if action_type else ""
 
-            console.print(f"  [{step.id}] {step.desc}{action_hint}{screenshot_icon}")
+            lines.append(console.render_str(
+                f"  [{step.id}] {step.desc}{action_hint}{screenshot_icon}"
+            ))
             total_steps += 1
             if step.has_screenshot:
                 total_screenshots += 1
 
-    console.print()
-    console.print(f"[dim]Total: {total_steps} steps, {total_screenshots} screenshots[/dim]")
+    lines.append(Text())
+    lines.append(console.render_str(
+        f"[dim]Total: {total_steps} steps, {total_screenshots} screenshots[/dim]"
+    ))
+    console.print(Group(*lines))
+
+
+# (icon, color) by step/session status value. StepStatus is a str enum, so
+# members look up the same entries as the plain strings sessions report.
+_STATUS_STYLE = {
+    "passed": ("✓", "green"),
+    "failed": ("✗", "red"),
+}
+_PENDING_STYLE = ("○", "yellow")
+_FAILED_STYLE = _STATUS_STYLE["failed"]
+
+
+# Action keys shown as hints, in priority order when a step has several
+_ACTION_KEYS = ("goto", "fill", "click", "select", "upload", "login", "logout")
+_ACTION_KEY_SET = frozenset(_ACTION_KEYS)
 
 
 def _get_action_type(action) -> Optional[str]:
     """Get action type hint."""
     if action is None:
         return "verify"
-    if isinstance(action, dict):
-        if "goto" in action:
-            return "goto"
-        if "fill" in action:
-            return "fill"
-        if "click" in action:
-            return "click"
-        if "select" in action:
-            return "select"
-        if "upload" in action:
-            return "upload"
-        if "login" in action:
-            return "login"
-        if "logout" in action:
-            return "logout"
     if isinstance(action, list):
         return "multi"
+    if isinstance(action, dict):
+        keys = _ACTION_KEY_SET & action.keys()
+        if keys:
+            return next(k for k in _ACTION_KEYS if k in keys)
     return None
 
 
@@ -200,22 +275,27 @@ def run_scenario_cmd(
     video: bool = typer.Option(
         True, "--video/--no-video", "-v", help="Record video of scenario execution (default: on)"
     ),
+    concurrency: int = typer.Option(
+        1, "--concurrency", "-C", min=1,
+        help="Max concurrent steps in parts marked 'parallel: true' (needs --no-video)",
+    ),
 ):
     """Run all steps in scenario."""
-    import asyncio
+    from shayde.cli._runtime import run
     from shayde.core.scenario.runner import run_scenario
     from shayde.core.scenario.models import StepStatus
 
     console.print(f"\n[bold blue]Running scenario:[/bold blue] {file.name}")
 
     try:
-        session = asyncio.run(run_scenario(
+        session = run(run_scenario(
             scenario_path=file,
             output_dir=output_dir,
             base_url=base_url,
             stop_on_error=stop_on_error,
             part_filter=part,
             record_video=video,
+            concurrency=concurrency,
         ))
 
         # Print summary
@@ -223,8 +303,7 @@ def run_scenario_cmd(
         console.print()
         console.print("━" * 50)
 
-        status_icon = "✓" if result.status == StepStatus.PASSED else "✗"
-        status_color = "green" if result.status == StepStatus.PASSED else "red"
+        status_icon, status_color = _STATUS_STYLE.get(result.status, _FAILED_STYLE)
         console.print(f"[{status_color}]{status_icon} {result.status.value.upper()}[/{status_color}]")
 
         console.print(f"  Total: {result.total_steps} steps")
@@ -258,14 +337,14 @@ def run_step_cmd(
     ),
 ):
     """Execute a single step."""
-    import asyncio
+    from shayde.cli._runtime import run
     from shayde.core.scenario.runner import run_single_step
     from shayde.core.scenario.models import StepStatus
 
     console.print(f"\n[bold blue]Running step:[/bold blue] {step_id}")
 
     try:
-        result = asyncio.run(run_single_step(
+        result = run(run_single_step(
             scenario_path=file,
             step_id=step_id,
             output_dir=output_dir,
@@ -278,8 +357,7 @@ def run_step_cmd(
 
         # Print result
         console.print()
-        status_icon = "✓" if result.status == StepStatus.PASSED else "✗"
-        status_color = "green" if result.status == StepStatus.PASSED else "red"
+        status_icon, status_color = _STATUS_STYLE.get(result.status, _FAILED_STYLE)
         console.print(f"[{status_color}]{status_icon} {result.desc}[/{status_color}]")
 
         if result.screenshot:
@@ -301,7 +379,7 @@ def run_step_cmd(
 @app.command("report")
 def generate_report_cmd(
     results_dir: Path = typer.Argument(
-        ..., help="Directory containing results.json", exists=True
+        ..., help="Directory containing results.json (or results.jsonl)", exists=True
     ),
     output: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Output file path (default: report.md in results_dir)"
@@ -327,6 +405,32 @@ def generate_report_cmd(
 # =============================================================================
 
 
+def _session_call(manager_method: str, client_method: str, **kwargs):
+    """Run a session operation on the shayde server, or in-process without one.
+
+    Sessions live in the process that created them, so only a running server
+    keeps them (and their browser context) alive between commands.
+    """
+    import inspect
+
+    from shayde.cli._runtime import run
+    from shayde.server.state import server_available
+
+    if server_available():
+        from shayde.server.client import ShaydeClient
+
+        async def call_server():
+            async with ShaydeClient() as client:
+                return await getattr(client, client_method)(**kwargs)
+
+        return run(call_server())
+
+    from shayde.core.scenario.session_manager import SessionManager
+
+    result = getattr(SessionManager, manager_method)(**kwargs)
+    return run(result) if inspect.isawaitable(result) else result
+
+
 @session_app.command("start")
 def session_start(
     file: Path = typer.Argument(..., help="Path to scenario YAML file", exists=True),
@@ -351,20 +455,19 @@ def session_start(
     Creates a new session for interactive step-by-step execution.
     Returns a session ID that can be used with other session commands.
     """
-    import asyncio
-    from shayde.core.scenario.session_manager import SessionManager
-
     try:
-        info = asyncio.run(SessionManager.create(
+        info = _session_call(
+            "create",
+            "create_session",
             yaml_path=file,
             output_dir=output_dir,
             base_url=base_url,
             record_video=video,
             start_part=part,
-        ))
+        )
 
         if json_output:
-            console.print_json(json.dumps(info.to_dict(), ensure_ascii=False))
+            print_json(console, info.to_dict())
         else:
             console.print(f"\n[bold green]Session started:[/bold green] {info.session_id}")
             console.print(f"  Scenario: {info.scenario_title}")
@@ -396,47 +499,49 @@ def session_step(
     Use --retry to re-run the current step.
     Use --skip to skip the current step.
     """
-    import asyncio
-    from shayde.core.scenario.session_manager import SessionManager
-    from shayde.core.scenario.models import StepStatus
+    from rich.console import Group
 
     try:
-        result = asyncio.run(SessionManager.execute_next_step(
+        result = _session_call(
+            "execute_next_step",
+            "execute_next_step",
             session_id=session_id,
             retry=retry,
             skip=skip,
-        ))
+        )
 
         if json_output:
-            console.print_json(json.dumps(result.to_dict(), ensure_ascii=False))
+            print_json(console, result.to_dict())
         else:
             # Status icon
-            status = result.result.status
-            if status == StepStatus.PASSED:
-                icon = "[green]✓[/green]"
-            elif status == StepStatus.FAILED:
-                icon = "[red]✗[/red]"
-            else:
-                icon = "[yellow]○[/yellow]"
+            status_icon, status_color = _STATUS_STYLE.get(result.result.status, _PENDING_STYLE)
+            icon = f"[{status_color}]{status_icon}[/{status_color}]"
 
-            console.print(f"\n{icon} [bold]Step {result.step_id}:[/bold] {result.step_desc}")
-            console.print(f"  Part: {result.part_num} - {result.part_title}")
-            console.print(f"  Duration: {result.result.duration_ms}ms")
+            # Emitted as one print: scripted loops call this once per step
+            lines = [
+                f"\n{icon} [bold]Step {result.step_id}:[/bold] {result.step_desc}",
+                f"  Part: {result.part_num} - {result.part_title}",
+                f"  Duration: {result.result.duration_ms}ms",
+            ]
 
             if result.result.screenshot:
-                console.print(f"  📸 {result.result.screenshot}")
+                lines.append(f"  📸 {result.result.screenshot}")
 
             if result.result.error:
-                console.print(f"  [red]Error: {result.result.error}[/red]")
+                lines.append(f"  [red]Error: {result.result.error}[/red]")
 
             # Next step info
             if result.is_completed:
-                console.print(f"\n[bold green]✓ Scenario completed![/bold green]")
-                console.print(f"End session with: [bold]shayde scenario session end {session_id}[/bold]")
+                lines.append("\n[bold green]✓ Scenario completed![/bold green]")
+                lines.append(
+                    f"End session with: [bold]shayde scenario session end {session_id}[/bold]"
+                )
             else:
-                console.print(f"\n  Next: Part {result.next_part}, Step {result.next_step}")
+                lines.append(f"\n  Next: Part {result.next_part}, Step {result.next_step}")
                 if result.is_account_change:
-                    console.print("  [yellow]Account switch will occur[/yellow]")
+                    lines.append("  [yellow]Account switch will occur[/yellow]")
+
+            console.print(Group(*(console.render_str(line) for line in lines)))
 
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -457,16 +562,13 @@ def session_end(
 
     Closes the browser context, saves the video, and returns final results.
     """
-    import asyncio
-    from shayde.core.scenario.session_manager import SessionManager
-
     try:
-        result = asyncio.run(SessionManager.end(session_id))
+        result = _session_call("end", "end_session", session_id=session_id)
 
         if json_output:
-            console.print_json(json.dumps(result.to_dict(), ensure_ascii=False))
+            print_json(console, result.to_dict())
         else:
-            status_color = "green" if result.status == "passed" else "red" if result.status == "failed" else "yellow"
+            _, status_color = _STATUS_STYLE.get(result.status, _PENDING_STYLE)
             console.print(f"\n[bold {status_color}]Session ended: {result.status.upper()}[/bold {status_color}]")
             console.print(f"  Total: {result.total_steps} steps")
             console.print(f"  Passed: [green]{result.passed}[/green]")
@@ -495,12 +597,12 @@ def session_list(
     ),
 ):
     """List active sessions."""
-    from shayde.core.scenario.session_manager import SessionManager
+    from rich.table import Table
 
-    sessions = SessionManager.list_sessions()
+    sessions = _session_call("list_sessions", "list_sessions")
 
     if json_output:
-        console.print_json(json.dumps([s.to_dict() for s in sessions], ensure_ascii=False))
+        print_json(console, [s.to_dict() for s in sessions])
     else:
         if not sessions:
             console.print("[dim]No active sessions[/dim]")
@@ -535,16 +637,14 @@ def session_info(
     ),
 ):
     """Get session details."""
-    from shayde.core.scenario.session_manager import SessionManager
-
-    info = SessionManager.get_session(session_id)
+    info = _session_call("get_session", "get_session", session_id=session_id)
 
     if info is None:
         console.print(f"[red]Session not found:[/red] {session_id}")
         raise typer.Exit(1)
 
     if json_output:
-        console.print_json(json.dumps(info.to_dict(), ensure_ascii=False))
+        print_json(console, info.to_dict())
     else:
         console.print(f"\n[bold]Session {info.session_id}[/bold]")
         console.print(f"  Scenario: {info.scenario_title} ({info.scenario_id})")
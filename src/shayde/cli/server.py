@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
+import atexit
 import os
+import select
 import signal
 import subprocess
 import sys
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
 
-from shayde.server.app import DEFAULT_PORT, PID_FILE, get_pid, is_running
-from shayde.server.client import ShaydeClient
+from shayde.server.state import (
+    DEFAULT_PORT,
+    PID_FILE,
+    READY_FD_ENV,
+    get_pid,
+    is_running,
+    server_available,
+)
+
+if TYPE_CHECKING:
+    from shayde.server.client import ShaydeClient
 
 console = Console()
 app = typer.Typer(help="Server management commands")
 
+_client: Optional[ShaydeClient] = None
+
+
+def _get_client() -> ShaydeClient:
+    """Return the client shared by this process's server commands."""
+    global _client
+    if _client is None:
+        from shayde.server.client import ShaydeClient
+
+        _client = ShaydeClient()
+        atexit.register(_client.close_sync)
+    return _client
+
 
 @app.command()
 def start(
@@ -44,29 +68,36 @@ def start(
         # Daemonize
         console.print(f"[green]Starting server in background on port {port}...[/green]")
 
-        # Use subprocess to start server in background
-        cmd = [
-            sys.executable,
-            "-c",
-            f"from shayde.server.app import run_server; run_server(ws_url='{ws_url}', port={port})",
-        ]
-
-        # Start process detached
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-            start_new_session=True,
-        )
-
-        # Wait for server to start
-        for _ in range(30):
-            time.sleep(0.1)
-            if ShaydeClient.server_available(port):
-                break
-
-        if ShaydeClient.server_available(port):
+        if os.name == "posix":
+            # Fork the already-loaded interpreter instead of starting a new
+            # one; the server reports readiness (or dies) over a pipe
+            ready_r, ready_w = os.pipe()
+            _fork_server(ws_url, port, ready_r, ready_w)
+            os.close(ready_w)
+            try:
+                ready = _wait_for_ready_pipe(ready_r, timeout=3.0)
+            finally:
+                os.close(ready_r)
+        else:
+            # Use subprocess to start server in background
+            cmd = [
+                sys.executable,
+                "-c",
+                "from shayde.server.app import run_server; "
+                f"run_server(ws_url='{ws_url}', port={port})",
+            ]
+
+            # Start process detached
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            ready = _wait_for_port(process, port, timeout=3.0)
+
+        if ready:
             pid = get_pid()
             console.print(f"[green]Server started (PID: {pid})[/green]")
             console.print(f"  URL: http://127.0.0.1:{port}")
@@ -75,6 +106,84 @@ def start(
             raise typer.Exit(1)
 
 
+def _has_exited(pid: int) -> bool:
+    """Check whether a process has exited (including zombies awaiting reaping)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    # The daemon is reparented to init, which may reap it only much later
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            return f.read().rsplit(b")", 1)[1].split()[0] == b"Z"
+    except (OSError, IndexError):
+        return False
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait for a process to exit, polling with exponential backoff."""
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        if _has_exited(pid):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+
+
+def _fork_server(ws_url: str, port: int, ready_r: int, ready_w: int) -> None:
+    """Double-fork a detached server process (POSIX only)."""
+    pid = os.fork()
+    if pid:
+        # Reap the intermediate child; the server itself is reparented
+        os.waitpid(pid, 0)
+        return
+
+    status = 0
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+
+        os.close(ready_r)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        os.close(devnull)
+        os.environ[READY_FD_ENV] = str(ready_w)
+
+        from shayde.server.app import run_server
+        run_server(ws_url=ws_url, port=port)
+    except BaseException:
+        status = 1
+    finally:
+        # Never return into the CLI from the daemon
+        os._exit(status)
+
+
+def _wait_for_ready_pipe(fd: int, timeout: float) -> bool:
+    """Block until the server writes to its ready pipe, exits, or times out."""
+    # A ready byte means listening; EOF means the child exited before that
+    readable, _, _ = select.select([fd], [], [], timeout)
+    return bool(readable) and os.read(fd, 1) == b"1"
+
+
+def _wait_for_port(process: subprocess.Popen, port: int, timeout: float) -> bool:
+    """Probe the port with exponential backoff until it accepts connections."""
+    deadline = time.monotonic() + timeout
+    delay = 0.002
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        if server_available(port):
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+    return False
+
+
 @app.command()
 def stop():
     """Stop the Shayde server."""
@@ -84,32 +193,24 @@ def stop():
         return
 
     # Try graceful shutdown via HTTP first
-    if ShaydeClient.server_available():
+    stopped = False
+    if server_available():
         try:
-            client = ShaydeClient()
-            client.stop_sync()
-            time.sleep(0.5)
+            _get_client().stop_sync()
+            stopped = _wait_for_exit(pid, timeout=5.0)
         except Exception:
             pass
 
     # If still running, send SIGTERM
-    pid = get_pid()
-    if pid:
+    if not stopped:
         try:
             os.kill(pid, signal.SIGTERM)
-            # Wait for process to exit
-            for _ in range(50):
-                time.sleep(0.1)
-                try:
-                    os.kill(pid, 0)
-                except ProcessLookupError:
-                    break
+            _wait_for_exit(pid, timeout=5.0)
         except ProcessLookupError:
             pass
 
     # Clean up PID file
-    if PID_FILE.exists():
-        PID_FILE.unlink()
+    PID_FILE.unlink(missing_ok=True)
 
     console.print("[green]Server stopped[/green]")
 
@@ -128,10 +229,9 @@ def status():
     console.print(f"  URL: http://127.0.0.1:{DEFAULT_PORT}")
 
     # Check health
-    if ShaydeClient.server_available():
+    if server_available():
         try:
-            client = ShaydeClient()
-            health = client.health_sync()
+            health = _get_client().health_sync()
             console.print(f"  Browser connected: {health.get('browser_connected', False)}")
         except Exception as e:
             console.print(f"  [yellow]Health check failed: {e}[/yellow]")
@@ -145,6 +245,6 @@ def restart(
     ),
 ):
     """Restart the Shayde server."""
+    # stop() returns once the old process has exited
     stop()
-    time.sleep(0.5)
     start(port=port, ws_url=ws_url, foreground=False)
@@ -2,28 +2,89 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
+import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich.console import Console
 
-from shayde.config.loader import load_config
-from shayde.docker.manager import DockerManager
+from shayde.cli._utils import status
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
 app = typer.Typer(no_args_is_help=True)
 
+_TEST_SUFFIXES = (".spec.ts", ".test.ts")
+_WS_ENDPOINT_ENV = "PW_TEST_CONNECT_WS_ENDPOINT"
+
+# Characters that need a real shell (pipes, redirects, expansion, VAR=value, ...)
+_SHELL_CHARS = re.compile(r"[|&;<>()$`\\*?\[\]{}~#=\n]")
+# Shell builtins, which have no executable to run directly (or one that
+# cannot affect the shell, like /usr/bin/cd)
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "alias", "builtin", "cd", "command", "declare", "eval", "exec",
+    "exit", "export", "hash", "local", "popd", "pushd", "readonly", "return",
+    "set", "shift", "shopt", "source", "trap", "type", "typeset", "ulimit",
+    "umask", "unalias", "unset", "wait",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _needs_shell(command: str) -> bool:
+    """Return True if the command uses shell syntax or starts with a builtin."""
+    if _SHELL_CHARS.search(command):
+        return True
+    words = command.split(maxsplit=1)
+    return bool(words) and words[0] in _SHELL_BUILTINS
+
 
 def _run_before_command(command: str) -> bool:
     """Run the before command on the host."""
+    console = _console()
     console.print(f"[dim]Running: {command}[/dim]")
-    result = subprocess.run(command, shell=True, cwd=Path.cwd())
+
+    # Plain commands are exec'd directly; anything using shell syntax still gets a shell
+    if _needs_shell(command):
+        result = subprocess.run(command, shell=True, cwd=Path.cwd())
+    else:
+        try:
+            result = subprocess.run(shlex.split(command), cwd=Path.cwd())
+        except (OSError, ValueError) as e:
+            console.print(f"[red]✗[/red] {e}")
+            return False
     return result.returncode == 0
 
 
+def _find_tests(root: Path) -> List[Path]:
+    """Return the Playwright test files under root, sorted, in a single walk."""
+    found: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(_TEST_SUFFIXES) and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return sorted(found)
+
+
 def _build_playwright_args(
     files: List[str],
     headed: bool,
@@ -34,37 +95,35 @@ def _build_playwright_args(
     timeout: int,
     config_file: Optional[str],
     update_snapshots: bool,
+    shard: Optional[str] = None,
 ) -> List[str]:
     """Build Playwright test command arguments."""
-    args = ["npx", "playwright", "test"]
-
-    if files:
-        args.extend(files)
-
-    if headed:
-        args.append("--headed")
-
-    if debug:
-        args.append("--debug")
+    args = ["npx", "playwright", "test", *files]
 
-    if grep:
-        args.extend(["--grep", grep])
-
-    if workers > 0:
-        args.extend(["--workers", str(workers)])
-
-    if retries > 0:
-        args.extend(["--retries", str(retries)])
-
-    if timeout > 0:
-        args.extend(["--timeout", str(timeout)])
-
-    if config_file:
-        args.extend(["--config", config_file])
+    flags = (
+        ("--headed", headed),
+        ("--debug", debug),
+    )
+    args += [flag for flag, enabled in flags if enabled]
+
+    # Counts of 0 or less are left to Playwright (workers: based on CPU count)
+    options = (
+        ("--grep", grep),
+        ("--workers", workers > 0 and str(workers)),
+        ("--retries", retries > 0 and str(retries)),
+        ("--timeout", timeout > 0 and str(timeout)),
+        ("--config", config_file),
+    )
+    for name, value in options:
+        if value:
+            args += [name, value]
 
     if update_snapshots:
         args.append("--update-snapshots")
 
+    if shard:
+        args += ["--shard", shard]
+
     return args
 
 
@@ -94,7 +153,7 @@ def test_run(
         None,
         "--workers",
         "-j",
-        help="Number of parallel workers",
+        help="Number of parallel workers (0 = auto)",
     ),
     retries: Optional[int] = typer.Option(
         None,
@@ -107,20 +166,37 @@ def test_run(
         "-u",
         help="Update visual snapshots",
     ),
+    shard: Optional[str] = typer.Option(
+        None,
+        "--shard",
+        help="Run only one shard of the suite, e.g. 1/3",
+    ),
     skip_before: bool = typer.Option(
         False,
         "--skip-before",
         help="Skip running the before command",
     ),
+    cache_state: bool = typer.Option(
+        True,
+        "--cache-state/--no-cache-state",
+        help="Reuse a container check from the last few seconds",
+    ),
 ):
     """Run Playwright E2E tests."""
+    from shayde.config.loader import load_config
+    from shayde.docker.manager import DockerManager
+
+    console = _console()
     config = load_config()
     manager = DockerManager(config)
 
     # Ensure Docker container is running
-    if not manager.is_container_running():
+    running = (
+        manager.is_container_running_cached() if cache_state else manager.is_container_running()
+    )
+    if not running:
         console.print("[yellow]Container not running, starting...[/yellow]")
-        with console.status("[bold green]Starting container..."):
+        with status(console, "[bold green]Starting container..."):
             if not manager.start():
                 console.print("[red]✗[/red] Failed to start container")
                 raise typer.Exit(1)
@@ -146,6 +222,7 @@ def test_run(
         timeout=config.test.timeout,
         config_file=config.test.config_file,
         update_snapshots=update_snapshots,
+        shard=shard,
     )
 
     # Get test directory
@@ -161,17 +238,18 @@ def test_run(
     console.print(f"[dim]Command: {' '.join(playwright_args)}[/dim]")
     console.print()
 
-    # Set environment for Playwright to connect to Docker container
-    import os
-    env = os.environ.copy()
-    env["PW_TEST_CONNECT_WS_ENDPOINT"] = manager.get_ws_url()
+    # Point Playwright at the Docker container; the child inherits os.environ
+    prev_endpoint = os.environ.get(_WS_ENDPOINT_ENV)
+    os.environ[_WS_ENDPOINT_ENV] = manager.get_ws_url()
 
     # Run playwright test
-    result = subprocess.run(
-        playwright_args,
-        cwd=Path.cwd(),
-        env=env,
-    )
+    try:
+        result = subprocess.run(playwright_args, cwd=Path.cwd())
+    finally:
+        if prev_endpoint is None:
+            os.environ.pop(_WS_ENDPOINT_ENV, None)
+        else:
+            os.environ[_WS_ENDPOINT_ENV] = prev_endpoint
 
     if result.returncode == 0:
         console.print()
@@ -185,6 +263,9 @@ def test_run(
 @app.command("list")
 def test_list():
     """List available test files."""
+    from shayde.config.loader import load_config
+
+    console = _console()
     config = load_config()
     test_dir = Path.cwd() / config.test.directory
 
@@ -192,15 +273,14 @@ def test_list():
         console.print(f"[yellow]Test directory {test_dir} does not exist[/yellow]")
         raise typer.Exit(1)
 
-    # Find test files
-    test_files = list(test_dir.glob("**/*.spec.ts")) + list(test_dir.glob("**/*.test.ts"))
+    test_files = _find_tests(test_dir)
 
     if not test_files:
         console.print(f"[yellow]No test files found in {test_dir}[/yellow]")
         return
 
     console.print(f"[bold]Test files in {config.test.directory}:[/bold]")
-    for f in sorted(test_files):
+    for f in test_files:
         relative = f.relative_to(Path.cwd())
         console.print(f"  {relative}")
 
@@ -208,6 +288,9 @@ def test_list():
 @app.command("init")
 def test_init():
     """Initialize Playwright test setup."""
+    from shayde.config.loader import load_config
+
+    console = _console()
     config = load_config()
     test_dir = Path.cwd() / config.test.directory
 
@@ -2,72 +2,140 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Optional, Tuple
 
+from shayde import __version__
 from shayde.config.schema import ShaydeConfig
 
-
 CONFIG_FILENAMES = [".shayde.yaml", ".shayde.yml", "shayde.yaml", "shayde.yml"]
+_CONFIG_FILENAME_SET = frozenset(CONFIG_FILENAMES)
 GLOBAL_CONFIG_DIR = Path.home() / ".config" / "shayde"
 GLOBAL_CONFIG_FILE = GLOBAL_CONFIG_DIR / "config.yaml"
 
+# Opt-in cache of validated configs shared between CLI invocations
+CONFIG_CACHE_ENV = "SHAYDE_CONFIG_CACHE"
+CONFIG_CACHE_FILE = Path.home() / ".cache" / "shayde" / "config.pkl"
+_CONFIG_CACHE_MAX_ENTRIES = 16
+
+# Port in a dev server URL like "http://0.0.0.0:5174" or "http://localhost:5173"
+_VITE_PORT_RE = re.compile(rb":(\d+)")
+
 
 def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
-    """Find configuration file in current or parent directories."""
+    """Find configuration file in current or parent directories.
+
+    Results are cached per start directory, keyed on the modification times
+    of the directories searched, so adding or removing a config file at any
+    level triggers a new search. ``load_config.cache_clear()`` drops the cache.
+    """
     if start_dir is None:
         start_dir = Path.cwd()
 
-    current = start_dir.resolve()
-
-    # Search upward for config file
-    while current != current.parent:
+    start = start_dir.resolve()
+    # The filesystem root itself is not searched
+    levels = (start, *list(start.parents)[:-1]) if start != start.parent else ()
+    return _find_config_file_cached(tuple((d, _mtime_ns(d)) for d in levels))
+
+
+@functools.lru_cache(maxsize=32)
+def _find_config_file_cached(
+    levels: Tuple[Tuple[Path, Optional[int]], ...]
+) -> Optional[Path]:
+    """Search ``levels`` bottom-up (cached by ``find_config_file``)."""
+    # One directory listing per level
+    for current, _ in levels:
+        try:
+            with os.scandir(current) as it:
+                present = {entry.name for entry in it if entry.name in _CONFIG_FILENAME_SET}
+        except OSError:
+            present = set()
         for filename in CONFIG_FILENAMES:
-            config_path = current / filename
-            if config_path.exists():
-                return config_path
-        current = current.parent
+            if filename in present:
+                return current / filename
 
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _yaml_safe_classes() -> Tuple[Any, Any]:
+    """Return the (loader, dumper) classes, importing PyYAML on first use.
+
+    Prefers the libyaml-backed classes and falls back to pure Python.
+    """
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+
+        return CSafeLoader, CSafeDumper
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeDumper, SafeLoader
+
+        return SafeLoader, SafeDumper
+
+
 def load_yaml_file(path: Path) -> Dict[str, Any]:
-    """Load YAML configuration file."""
-    if not path.exists():
+    """Load YAML configuration file.
+
+    Parsed files are cached per process, keyed on path, mtime and size; the
+    returned dict is shared between callers and must not be modified.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
         return {}
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        return data if data else {}
+    return _load_yaml_file_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_file_cached(path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file (cached by ``load_yaml_file``)."""
+    import yaml
+
+    loader, _ = _yaml_safe_classes()
+    # Whole file as bytes: libyaml decodes it in one go
+    data = yaml.load(path.read_bytes(), Loader=loader)
+    return data if data else {}
 
 
-def get_app_url_from_env(env_file: str = ".env", env_var: str = "APP_URL") -> Optional[str]:
-    """Read APP_URL from .env file."""
-    env_path = Path.cwd() / env_file
-    if not env_path.exists():
+def get_app_url_from_env(
+    env_file: str = ".env",
+    env_var: str = "APP_URL",
+    base_dir: Optional[Path] = None,
+) -> Optional[str]:
+    """Read APP_URL from .env file in ``base_dir`` (default: current directory)."""
+    env_path = (base_dir or Path.cwd()) / env_file
+    try:
+        stat = env_path.stat()
+    except OSError:
         return None
 
-    with open(env_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith(f"{env_var}="):
-                return line.split("=", 1)[1].strip().strip('"').strip("'")
+    return _load_env_file_cached(env_path, stat.st_mtime_ns, stat.st_size).get(env_var)
 
-    return None
 
+@functools.lru_cache(maxsize=8)
+def _load_env_file_cached(path: Path, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Parse all KEY=value pairs of a .env file (cached by ``get_app_url_from_env``)."""
+    values: Dict[str, str] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            key, sep, value = line.strip().partition("=")
+            if sep:
+                # First definition wins
+                values.setdefault(key, value.strip().strip('"').strip("'"))
+    return values
 
-def detect_vite_port() -> Optional[int]:
+
+def detect_vite_port(base_dir: Optional[Path] = None) -> Optional[int]:
     """Detect Vite dev server port from hot file or config."""
     # Check Laravel's hot file
-    hot_file = Path.cwd() / "public" / "hot"
+    hot_file = (base_dir or Path.cwd()) / "public" / "hot"
     if hot_file.exists():
-        content = hot_file.read_text().strip()
-        # Parse URL like "http://0.0.0.0:5174" or "http://localhost:5173"
-        import re
-        match = re.search(r":(\d+)", content)
+        # The hot file holds a plain ASCII URL; no need to decode it
+        match = _VITE_PORT_RE.search(hot_file.read_bytes())
         if match:
             return int(match.group(1))
 
@@ -75,6 +143,16 @@ def detect_vite_port() -> Optional[int]:
     return 5173
 
 
+def _mtime_ns(path: Optional[Path]) -> Optional[int]:
+    """Return modification time of a file in ns, or None if it is missing."""
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_config(
     config_file: Optional[Path] = None,
     project_dir: Optional[Path] = None,
@@ -86,50 +164,200 @@ def load_config(
     2. Global config (~/.config/shayde/config.yaml)
     3. Project config (.shayde.yaml)
     4. Explicit config file (if provided)
+
+    ``project_dir`` is where the project config is searched for and where
+    ``.env`` and ``public/hot`` are read (defaults to the current directory).
+
+    The result is cached per process, keyed on the project directory and the
+    modification times of the config, ``.env`` and ``public/hot`` files. Use
+    ``load_config.cache_clear()`` to drop the cache. With
+    ``SHAYDE_CONFIG_CACHE=1`` the validated config is also kept in
+    ``~/.cache/shayde/config.pkl`` for later invocations.
     """
+    if config_file is None:
+        config_file = find_config_file(project_dir)
+    else:
+        # Key the cache on the absolute path, not on how it was spelled
+        config_file = Path(config_file).resolve()
+
+    cwd = Path(project_dir).resolve() if project_dir is not None else Path.cwd()
+    global_mtime_ns = _mtime_ns(GLOBAL_CONFIG_FILE)
+    config_mtime_ns = _mtime_ns(config_file)
+    # The .env file name comes from the config itself
+    base = _load_base_config_cached(cwd, config_file, global_mtime_ns, config_mtime_ns)
+
+    return _load_config_cached(
+        cwd,
+        config_file,
+        global_mtime_ns,
+        config_mtime_ns,
+        _mtime_ns(cwd / base.app.env_file),
+        _mtime_ns(cwd / "public" / "hot"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    cwd: Path,
+    config_file: Optional[Path],
+    global_mtime_ns: Optional[int],
+    config_mtime_ns: Optional[int],
+    env_mtime_ns: Optional[int],
+    hot_mtime_ns: Optional[int],
+) -> ShaydeConfig:
+    """Return the merged configuration (cached by ``load_config``)."""
+    if os.environ.get(CONFIG_CACHE_ENV) != "1":
+        return _build_config(cwd, config_file, global_mtime_ns, config_mtime_ns)
+
+    key = (str(cwd), str(config_file) if config_file else None)
+    config = _read_persistent_config(key)
+    if config is None:
+        config = _build_config(cwd, config_file, global_mtime_ns, config_mtime_ns)
+        _write_persistent_config(key, config)
+    return config
+
+
+@functools.lru_cache(maxsize=8)
+def _load_base_config_cached(
+    cwd: Path,
+    config_file: Optional[Path],
+    global_mtime_ns: Optional[int],
+    config_mtime_ns: Optional[int],
+) -> ShaydeConfig:
+    """Merge and validate the config files, without auto-detection."""
     # Start with defaults
     config_data: Dict[str, Any] = {}
 
     # Load global config
-    if GLOBAL_CONFIG_FILE.exists():
+    if global_mtime_ns is not None:
         global_data = load_yaml_file(GLOBAL_CONFIG_FILE)
         config_data = _deep_merge(config_data, global_data)
 
-    # Find and load project config
-    if config_file is None:
-        config_file = find_config_file(project_dir)
-
-    if config_file and config_file.exists():
+    # Load project config
+    if config_mtime_ns is not None:
         project_data = load_yaml_file(config_file)
         config_data = _deep_merge(config_data, project_data)
 
-    # Create config object
-    config = ShaydeConfig(**config_data) if config_data else ShaydeConfig()
+    # Create config object; validated once per file version, cache hits reuse it
+    return ShaydeConfig.model_validate(config_data)
+
+
+def _config_dependencies(
+    key: Tuple[str, Optional[str]], config: ShaydeConfig
+) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Return (path, mtime) of every file a config was built from."""
+    cwd = Path(key[0])
+    paths = [GLOBAL_CONFIG_FILE, cwd / config.app.env_file, cwd / "public" / "hot"]
+    if key[1] is not None:
+        paths.append(Path(key[1]))
+    return tuple((str(path), _mtime_ns(path)) for path in paths)
+
+
+def _read_persistent_entries() -> Dict[Any, Any]:
+    """Load all persistent cache entries, or nothing if the file is unusable."""
+    import pickle
+
+    try:
+        with open(CONFIG_CACHE_FILE, "rb") as f:
+            entries = pickle.load(f)
+    except Exception:
+        # Missing, unreadable or written by an incompatible version
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _read_persistent_config(key: Tuple[str, Optional[str]]) -> Optional[ShaydeConfig]:
+    """Return the cached config for ``key`` if none of its files changed."""
+    entry = _read_persistent_entries().get(key)
+    if entry is None:
+        return None
+    version, dependencies, config = entry
+    if version != __version__ or dependencies != _config_dependencies(key, config):
+        return None
+    return config
+
+
+def _write_persistent_config(key: Tuple[str, Optional[str]], config: ShaydeConfig) -> None:
+    """Store ``config`` in the persistent cache (atomically, best effort)."""
+    import pickle
+    import tempfile
+
+    entries = _read_persistent_entries()
+    entries.pop(key, None)
+    entries[key] = (__version__, _config_dependencies(key, config), config)
+    while len(entries) > _CONFIG_CACHE_MAX_ENTRIES:
+        del entries[next(iter(entries))]
+
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CONFIG_CACHE_FILE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CONFIG_CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _build_config(
+    cwd: Path,
+    config_file: Optional[Path],
+    global_mtime_ns: Optional[int],
+    config_mtime_ns: Optional[int],
+) -> ShaydeConfig:
+    """Build the merged configuration from the config files."""
+    config = _load_base_config_cached(cwd, config_file, global_mtime_ns, config_mtime_ns)
 
     # Auto-detect APP_URL if not set
     if config.app.base_url is None:
-        detected_url = get_app_url_from_env(config.app.env_file, config.app.env_var)
+        detected_url = get_app_url_from_env(config.app.env_file, config.app.env_var, cwd)
         if detected_url:
-            config.app.base_url = detected_url
+            app = config.app.model_copy(update={"base_url": detected_url})
+            config = config.model_copy(update={"app": app})
 
     # Auto-detect Vite port if not set
     if config.proxy.vite_port is None:
-        detected_port = detect_vite_port()
+        detected_port = detect_vite_port(cwd)
         if detected_port:
-            config.proxy.vite_port = detected_port
+            proxy = config.proxy.model_copy(update={"vite_port": detected_port})
+            config = config.model_copy(update={"proxy": proxy})
 
     return config
 
 
+def _cache_clear() -> None:
+    _load_config_cached.cache_clear()
+    _load_base_config_cached.cache_clear()
+    _load_yaml_file_cached.cache_clear()
+    _load_env_file_cached.cache_clear()
+    _find_config_file_cached.cache_clear()
+
+
+load_config.cache_clear = _cache_clear  # type: ignore[attr-defined]
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge two dictionaries."""
-    result = base.copy()
+    """Deep merge two dictionaries.
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    Neither input is mutated: nested dicts from ``base`` are copied before
+    being merged into, so cached YAML data stays intact.
+    """
+    result = {**base}
+    stack = [(result, override)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = {**current}
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
 
     return result
 
@@ -138,7 +366,17 @@ def save_config(config: ShaydeConfig, path: Path) -> None:
     """Save configuration to YAML file."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    data = config.model_dump(exclude_defaults=True)
+    import yaml
+
+    _, dumper = _yaml_safe_classes()
+    data = config.model_dump(mode="json", exclude_defaults=True)
 
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(
+            data,
+            f,
+            Dumper=dumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Platform types for font simulation
 PlatformType = Literal["neutral", "mac", "windows"]
 
 
-class ViewportConfig(BaseModel):
+class _FrozenModel(BaseModel):
+    """Base for config models; loaded configs are shared, so they are immutable."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ViewportConfig(_FrozenModel):
     """Viewport configuration."""
 
     width: int = 1920
@@ -20,7 +27,7 @@ class ViewportConfig(BaseModel):
     device_scale_factor: float = 1.0
 
 
-class FontConfig(BaseModel):
+class FontConfig(_FrozenModel):
     """Font configuration for platform simulation."""
 
     platform: PlatformType = "mac"
@@ -28,7 +35,7 @@ class FontConfig(BaseModel):
     css_override: Optional[str] = None  # Custom CSS for font-family
 
 
-class AppConfig(BaseModel):
+class AppConfig(_FrozenModel):
     """Application URL configuration."""
 
     base_url: Optional[str] = None
@@ -36,7 +43,7 @@ class AppConfig(BaseModel):
     env_var: str = "APP_URL"
 
 
-class ProxyConfig(BaseModel):
+class ProxyConfig(_FrozenModel):
     """Dev server proxy configuration."""
 
     enabled: bool = True
@@ -45,7 +52,7 @@ class ProxyConfig(BaseModel):
     websocket: bool = True
 
 
-class DockerConfig(BaseModel):
+class DockerConfig(_FrozenModel):
     """Docker container configuration."""
 
     playwright_version: str = "1.48.0"
@@ -57,7 +64,7 @@ class DockerConfig(BaseModel):
     image_name: str = "shayde-playwright"  # Custom image name
 
 
-class OutputConfig(BaseModel):
+class OutputConfig(_FrozenModel):
     """Screenshot output configuration."""
 
     directory: str = "storage/screenshots"
@@ -67,7 +74,7 @@ class OutputConfig(BaseModel):
     time_format: str = "%H%M%S"
 
 
-class CaptureConfig(BaseModel):
+class CaptureConfig(_FrozenModel):
     """Default capture settings."""
 
     default_viewport: str = "desktop"
@@ -77,14 +84,14 @@ class CaptureConfig(BaseModel):
     quality: Optional[int] = None
 
 
-class VideoConfig(BaseModel):
+class VideoConfig(_FrozenModel):
     """Video recording configuration for scenarios."""
 
     enabled: bool = False
     size: Optional[Dict[str, int]] = None  # {"width": 1920, "height": 1080}
 
 
-class RegressionConfig(BaseModel):
+class RegressionConfig(_FrozenModel):
     """Visual regression settings."""
 
     baseline_dir: str = "storage/baselines"
@@ -95,7 +102,7 @@ class RegressionConfig(BaseModel):
     update_snapshots: Literal["none", "missing", "all"] = "none"
 
 
-class TestConfig(BaseModel):
+class TestConfig(_FrozenModel):
     """E2E test configuration for Playwright."""
 
     directory: str = "tests/e2e"
@@ -106,13 +113,13 @@ class TestConfig(BaseModel):
     workers: int = 1  # Number of parallel workers
 
 
-class DialogConfig(BaseModel):
+class DialogConfig(_FrozenModel):
     """Dialog (alert/confirm/prompt) handling configuration."""
 
     auto_accept: bool = True  # Automatically accept all dialogs
 
 
-class ShaydeConfig(BaseModel):
+class ShaydeConfig(_FrozenModel):
     """Root configuration model for Shayde."""
 
     version: int = 1
@@ -135,5 +142,11 @@ class ShaydeConfig(BaseModel):
 
     @classmethod
     def get_default(cls) -> "ShaydeConfig":
-        """Return default configuration."""
-        return cls()
+        """Return default configuration (a shared immutable instance)."""
+        return _get_default(cls)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default(cls: type) -> ShaydeConfig:
+    """Build the default configuration once per config class."""
+    return cls()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -10,6 +11,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Still on the login page (login failed) if the URL contains this
+_LOGIN_URL_RE = re.compile(r"/login", re.IGNORECASE)
+
+
+def _left_login_page(url: str) -> bool:
+    """Return True if the URL is not a login page."""
+    return _LOGIN_URL_RE.search(url) is None
+
 
 async def login_with_form(
     page: Page,
@@ -33,7 +42,8 @@ async def login_with_form(
         password_field: CSS selector for password input
         submit_button: CSS selector for submit button
         success_indicator: CSS selector to wait for after login (optional)
-        wait_after_login: Time to wait after login in ms
+        wait_after_login: Time to wait after login in ms (upper bound when
+            the login page URL contains /login; the redirect ends the wait)
 
     Returns:
         True if login was successful
@@ -64,13 +74,22 @@ async def login_with_form(
             logger.error(f"Login failed: {e}")
             return False
     else:
-        # Wait for navigation to complete
-        await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(wait_after_login)
+        if _left_login_page(page.url):
+            # Cannot tell from the URL when login completes; wait for things to settle
+            await page.wait_for_load_state("networkidle")
+            await page.wait_for_timeout(wait_after_login)
+        else:
+            # Return as soon as the app redirects away from the login page
+            from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+            try:
+                await page.wait_for_url(_left_login_page, timeout=max(wait_after_login, 10000))
+            except PlaywrightTimeoutError:
+                pass
 
         # Check if we're still on login page (login failed)
         current_url = page.url
-        if "/login" in current_url.lower():
+        if not _left_login_page(current_url):
             logger.warning("Login may have failed (still on login page)")
             return False
 
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, AsyncContextManager
-
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
     from shayde.config.schema import ShaydeConfig, ViewportConfig
 
 logger = logging.getLogger(__name__)
@@ -20,12 +20,19 @@ class BrowserManager:
         self.ws_url = ws_url
         self._playwright = None
         self._browser: Browser | None = None
+        # Idle contexts keyed by (width, height, device_scale_factor); None = default
+        self._idle_contexts: Dict[Optional[Tuple[int, int, float]], List[BrowserContext]] = {}
+        # Pool key of every open pooled context, idle or in use
+        self._context_keys: Dict[BrowserContext, Optional[Tuple[int, int, float]]] = {}
+        self._contexts_lock = asyncio.Lock()
 
     async def connect(self) -> Browser:
         """Connect to Playwright WebSocket server."""
         if self._browser:
             return self._browser
 
+        from playwright.async_api import async_playwright
+
         logger.info(f"Connecting to Playwright at {self.ws_url}")
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.connect(self.ws_url)
@@ -34,6 +41,14 @@ class BrowserManager:
 
     async def disconnect(self) -> None:
         """Disconnect from Playwright."""
+        for context in self._context_keys:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close context: {e}")
+        self._context_keys.clear()
+        self._idle_contexts.clear()
+
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -44,27 +59,91 @@ class BrowserManager:
 
         logger.info("Disconnected from Playwright")
 
+    async def get_or_create_context(
+        self,
+        viewport: ViewportConfig | None = None,
+    ) -> BrowserContext:
+        """Take an idle pooled context for the viewport, creating one if needed.
+
+        The context belongs to the caller until ``release_page()`` returns it
+        to the pool, so concurrent captures never share cookies or storage.
+        Contexts stay open until ``disconnect()`` so sequential captures with
+        the same viewport avoid a context round-trip each time.
+        """
+        key = (
+            (viewport.width, viewport.height, viewport.device_scale_factor)
+            if viewport else None
+        )
+
+        async with self._contexts_lock:
+            idle = self._idle_contexts.get(key)
+            if idle:
+                return idle.pop()
+
+            if not self._browser:
+                await self.connect()
+
+            viewport_dict = None
+            if viewport:
+                viewport_dict = {
+                    "width": viewport.width,
+                    "height": viewport.height,
+                }
+
+            context = await self._browser.new_context(
+                viewport=viewport_dict,
+                device_scale_factor=viewport.device_scale_factor if viewport else 1,
+            )
+            self._context_keys[context] = key
+
+        return context
+
     async def new_page(
         self,
         viewport: ViewportConfig | None = None,
     ) -> Page:
-        """Create a new page with specified viewport."""
-        if not self._browser:
-            await self.connect()
-
-        viewport_dict = None
-        if viewport:
-            viewport_dict = {
-                "width": viewport.width,
-                "height": viewport.height,
-            }
-
-        context = await self._browser.new_context(
-            viewport=viewport_dict,
-            device_scale_factor=viewport.device_scale_factor if viewport else 1,
-        )
-        page = await context.new_page()
-        return page
+        """Create a new page with specified viewport.
+
+        The page lives in a pooled context; hand it back with
+        ``release_page()`` instead of closing its context.
+        """
+        context = await self.get_or_create_context(viewport)
+        return await context.new_page()
+
+    async def release_page(self, page: Page) -> None:
+        """Close a page from ``new_page()`` and return its context to the pool.
+
+        Cookies and the page's local/session storage are cleared first so
+        the next capture starts from a clean state; a context that still
+        holds storage afterwards (e.g. from other origins) is closed instead
+        of being reused.
+        """
+        context = page.context
+        try:
+            await page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        except Exception as e:
+            # about:blank, opaque origins or storage disabled by the page
+            logger.debug(f"Failed to clear page storage: {e}")
+        await page.close()
+
+        if context not in self._context_keys:
+            return
+
+        try:
+            await context.clear_cookies()
+            state = await context.storage_state()
+            reusable = not state["cookies"] and not any(
+                origin.get("localStorage") for origin in state["origins"]
+            )
+        except Exception as e:
+            logger.debug(f"Failed to reset context: {e}")
+            reusable = False
+
+        if reusable:
+            self._idle_contexts.setdefault(self._context_keys[context], []).append(context)
+        else:
+            del self._context_keys[context]
+            await context.close()
 
     async def __aenter__(self) -> "BrowserManager":
         """Async context manager entry."""
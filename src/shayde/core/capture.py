@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin, urlparse
 
 if TYPE_CHECKING:
@@ -15,6 +28,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in generated screenshot filenames
+_SANITIZE_RE = re.compile(r"[^\w\-]")
+
 
 def resolve_url(url_or_path: str, base_url: Optional[str]) -> str:
     """Resolve URL or path to full URL."""
@@ -22,6 +38,17 @@ def resolve_url(url_or_path: str, base_url: Optional[str]) -> str:
         return url_or_path
 
     if base_url:
+        # Fast path for the common "origin + absolute path" case; urljoin
+        # gives the same result but parses both URLs
+        _, sep, authority = base_url.partition("://")
+        if (
+            sep
+            and url_or_path.startswith("/")
+            and not url_or_path.startswith("//")
+            and "/." not in url_or_path
+            and not any(c in authority.rstrip("/") for c in "/?#")
+        ):
+            return base_url.rstrip("/") + url_or_path
         return urljoin(base_url, url_or_path)
 
     # Assume localhost if no base URL
@@ -36,16 +63,33 @@ def generate_filename(
     pattern: str = "{name}_{date}_{time}.png",
     date_format: str = "%Y-%m-%d",
     time_format: str = "%H%M%S",
+    now: Optional[datetime] = None,
 ) -> str:
-    """Generate screenshot filename."""
-    now = datetime.now()
+    """Generate screenshot filename.
+
+    ``now`` fixes the timestamp used for ``{date}``/``{time}``; it defaults to
+    the current time.
+    """
+    if now is None:
+        now = datetime.now()
 
-    if name:
-        safe_name = re.sub(r"[^\w\-]", "_", name)
-    else:
-        parsed = urlparse(url)
-        path = parsed.path.strip("/") or "home"
-        safe_name = re.sub(r"[^\w\-]", "_", path)
+    return pattern.format(
+        name=_safe_name(url, name, viewport_name, platform_suffix),
+        date=now.strftime(date_format),
+        time=now.strftime(time_format),
+    )
+
+
+def _safe_name(
+    url: str,
+    name: Optional[str],
+    viewport_name: Optional[str],
+    platform_suffix: Optional[str],
+) -> str:
+    """Build the ``{name}`` part of a screenshot filename."""
+    if not name:
+        name = urlparse(url).path.strip("/") or "home"
+    safe_name = _SANITIZE_RE.sub("_", name)
 
     if viewport_name:
         safe_name = f"{safe_name}_{viewport_name}"
@@ -53,11 +97,7 @@ def generate_filename(
     if platform_suffix:
         safe_name = f"{safe_name}_{platform_suffix}"
 
-    return pattern.format(
-        name=safe_name,
-        date=now.strftime(date_format),
-        time=now.strftime(time_format),
-    )
+    return safe_name
 
 
 async def capture_screenshot(
@@ -68,6 +108,8 @@ async def capture_screenshot(
     wait_until: str = "networkidle",
     wait_after: int = 0,
     wait_for_selector: Optional[str] = None,
+    css: Optional[str] = None,
+    ensure_dir: bool = True,
 ) -> Path:
     """Capture a screenshot of a page.
 
@@ -79,6 +121,8 @@ async def capture_screenshot(
         wait_until: Navigation wait condition
         wait_after: Additional wait time in ms after page load
         wait_for_selector: CSS selector to wait for before capture
+        css: CSS to inject after navigation (e.g. platform fonts)
+        ensure_dir: Create the output directory if needed
 
     Returns:
         Path to saved screenshot
@@ -86,6 +130,9 @@ async def capture_screenshot(
     logger.info(f"Navigating to {url}")
     await page.goto(url, wait_until=wait_until)
 
+    if css:
+        await page.add_style_tag(content=css)
+
     if wait_for_selector:
         logger.debug(f"Waiting for selector: {wait_for_selector}")
         await page.wait_for_selector(wait_for_selector, timeout=10000)
@@ -95,7 +142,8 @@ async def capture_screenshot(
         await page.wait_for_timeout(wait_after)
 
     # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if ensure_dir:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Capturing screenshot to {output_path}")
     await page.screenshot(path=str(output_path), full_page=full_page)
@@ -103,28 +151,39 @@ async def capture_screenshot(
     return output_path
 
 
+@dataclass
+class CaptureSpec:
+    """A single capture request for ``CaptureSession.capture_many``."""
+
+    url_or_path: str
+    name: Optional[str] = None
+    viewport: Optional[Union[str, ViewportConfig]] = None
+    full_page: Optional[bool] = None
+    wait_for: Optional[str] = None
+    output_dir: Optional[Path] = None
+    platform_suffix: Optional[str] = None
+    platform: Optional[str] = None
+
+
 class CaptureSession:
     """Manages a capture session with browser and proxy."""
 
-    def __init__(self, config: "ShaydeConfig", platform: Optional[str] = None):
+    def __init__(self, config: ShaydeConfig, platform: Optional[str] = None):
         self.config = config
         self._platform = platform
         self._browser_manager = None
         self._proxy_manager = None
         self._docker_manager = None
         self._authenticated_context = None
+        self._render_filename: Optional[Callable[..., str]] = None
+        self._created_dirs: Set[Path] = set()
 
-    def get_platform_css(self) -> str:
-        """Get CSS for current platform's fonts."""
+    def get_platform_css(self, platform: Optional[str] = None) -> str:
+        """Get CSS for a platform's fonts (defaults to the session platform)."""
         from shayde.docker.manager import PLATFORM_CSS
-        platform = self._platform or self.config.fonts.platform
+        platform = platform or self._platform or self.config.fonts.platform
         return PLATFORM_CSS.get(platform, PLATFORM_CSS["neutral"])
 
-    async def _inject_platform_css(self, page) -> None:
-        """Inject platform-specific font CSS into the page."""
-        css = self.get_platform_css()
-        await page.add_style_tag(content=css)
-
     async def setup(self) -> None:
         """Set up capture session (Docker, proxy, browser)."""
         from shayde.docker.manager import DockerManager
@@ -150,6 +209,16 @@ class CaptureSession:
         self._browser_manager = BrowserManager(ws_url)
         await self._browser_manager.connect()
 
+        # All captures in this session share one timestamp, so bind the
+        # formatted date/time into the filename pattern once
+        now = datetime.now()
+        output = self.config.output
+        self._render_filename = functools.partial(
+            output.filename_pattern.format,
+            date=now.strftime(output.date_format),
+            time=now.strftime(output.time_format),
+        )
+
     async def teardown(self) -> None:
         """Tear down capture session."""
         if self._authenticated_context:
@@ -182,7 +251,7 @@ class CaptureSession:
             True if login was successful
         """
         from shayde.core.auth import login_with_form
-        from shayde.core.routes import create_route_handler
+        from shayde.core.routes import ROUTE_URL_PATTERN, create_route_handler
 
         # Resolve login URL
         if login_url is None:
@@ -197,7 +266,7 @@ class CaptureSession:
 
         # Set up route interception
         route_handler = create_route_handler(self.config)
-        await page.route("**/*", route_handler)
+        await page.route(ROUTE_URL_PATTERN, route_handler)
 
         # Perform login
         success = await login_with_form(
@@ -217,11 +286,12 @@ class CaptureSession:
         self,
         url_or_path: str,
         name: Optional[str] = None,
-        viewport: Optional[Union[str, "ViewportConfig"]] = None,
+        viewport: Optional[Union[str, ViewportConfig]] = None,
         full_page: Optional[bool] = None,
         wait_for: Optional[str] = None,
         output_dir: Optional[Path] = None,
         platform_suffix: Optional[str] = None,
+        platform: Optional[str] = None,
     ) -> Path:
         """Capture a single screenshot.
 
@@ -233,14 +303,16 @@ class CaptureSession:
             wait_for: CSS selector to wait for
             output_dir: Output directory override
             platform_suffix: Platform name to add to filename
+            platform: Font platform override for this capture only
 
         Returns:
             Path to saved screenshot
         """
-        from shayde.core.routes import create_route_handler
+        from shayde.core.routes import ROUTE_URL_PATTERN, create_route_handler
 
         # Resolve URL
         url = resolve_url(url_or_path, self.config.app.base_url)
+        platform = platform or self._platform
 
         # Resolve viewport
         viewport_config = None
@@ -269,58 +341,130 @@ class CaptureSession:
 
         # Set up route interception
         route_handler = create_route_handler(self.config)
-        await page.route("**/*", route_handler)
+        await page.route(ROUTE_URL_PATTERN, route_handler)
 
         try:
             # Generate output path (include platform_suffix if specified)
             output_directory = output_dir or Path.cwd() / self.config.output.directory
-            filename = generate_filename(
-                url,
-                name=name,
-                viewport_name=viewport_name,
-                platform_suffix=platform_suffix,
-                pattern=self.config.output.filename_pattern,
-                date_format=self.config.output.date_format,
-                time_format=self.config.output.time_format,
+            filename = self._render_filename(
+                name=_safe_name(url, name, viewport_name, platform_suffix),
             )
             output_path = output_directory / filename
 
-            # Navigate to page
-            logger.info(f"Navigating to {url}")
-            await page.goto(url, wait_until=self.config.capture.wait_until)
+            # Create each output directory once per session (the filename
+            # pattern may add subdirectories, e.g. "{date}/{name}.png")
+            parent = output_path.parent
+            if parent not in self._created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(parent)
 
-            # Inject platform-specific CSS for fonts
-            if self._platform:
-                await self._inject_platform_css(page)
+            # Navigate, wait and capture (platform fonts injected after load)
+            return await capture_screenshot(
+                page,
+                url,
+                output_path,
+                full_page=full_page if full_page is not None else self.config.capture.full_page,
+                wait_until=self.config.capture.wait_until,
+                wait_after=self.config.capture.wait_after,
+                wait_for_selector=wait_for,
+                css=self.get_platform_css(platform) if platform else None,
+                ensure_dir=False,
+            )
 
-            # Wait for selector if specified
-            if wait_for:
-                logger.debug(f"Waiting for selector: {wait_for}")
-                await page.wait_for_selector(wait_for, timeout=10000)
+        finally:
+            if self._authenticated_context:
+                await page.close()
+            else:
+                # Resets cookies/storage and returns the pooled context
+                await self._browser_manager.release_page(page)
 
-            # Additional wait after page load
-            if self.config.capture.wait_after > 0:
-                logger.debug(f"Waiting {self.config.capture.wait_after}ms after page load")
-                await page.wait_for_timeout(self.config.capture.wait_after)
+    async def capture_many(
+        self,
+        specs: List[CaptureSpec],
+        *,
+        max_concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> List[Union[Path, BaseException]]:
+        """Capture several screenshots concurrently.
 
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            specs: Capture requests
+            max_concurrency: Maximum number of pages open at once
+            return_exceptions: Return failures in place of paths instead of raising
 
-            # Capture screenshot
-            logger.info(f"Capturing screenshot to {output_path}")
-            await page.screenshot(
-                path=str(output_path),
-                full_page=full_page if full_page is not None else self.config.capture.full_page,
-            )
+        Returns:
+            Screenshot paths (or exceptions) in the same order as ``specs``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-            return output_path
+        async def capture_one(spec: CaptureSpec) -> Path:
+            async with semaphore:
+                return await self._capture_spec(spec)
 
+        return await asyncio.gather(
+            *[capture_one(spec) for spec in specs],
+            return_exceptions=return_exceptions,
+        )
+
+    async def capture_iter(
+        self,
+        specs: Iterable[CaptureSpec],
+        *,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[Tuple[CaptureSpec, Union[Path, Exception]]]:
+        """Capture several screenshots, yielding each one as it finishes.
+
+        A fixed pool of ``max_concurrency`` workers pulls from ``specs``, so
+        only that many captures are in flight however long the input is.
+
+        Args:
+            specs: Capture requests
+            max_concurrency: Maximum number of pages open at once
+
+        Yields:
+            ``(spec, path_or_exception)`` in completion order
+        """
+        pending = iter(specs)
+        done: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            try:
+                for spec in pending:
+                    try:
+                        result: Union[Path, Exception] = await self._capture_spec(spec)
+                    except Exception as e:
+                        result = e
+                    done.put_nowait((spec, result))
+            finally:
+                done.put_nowait(None)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+        remaining = len(workers)
+        try:
+            while remaining:
+                item = await done.get()
+                if item is None:
+                    remaining -= 1
+                else:
+                    yield item
         finally:
-            # Only close context if not using authenticated context
-            if not self._authenticated_context:
-                await page.context.close()
-            else:
-                await page.close()
+            # Like a TaskGroup: never leave workers running past the caller
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _capture_spec(self, spec: CaptureSpec) -> Path:
+        """Run ``capture`` for a ``CaptureSpec``."""
+        return await self.capture(
+            url_or_path=spec.url_or_path,
+            name=spec.name,
+            viewport=spec.viewport,
+            full_page=spec.full_page,
+            wait_for=spec.wait_for,
+            output_dir=spec.output_dir,
+            platform_suffix=spec.platform_suffix,
+            platform=spec.platform,
+        )
 
     async def __aenter__(self) -> "CaptureSession":
         """Async context manager entry."""
@@ -12,6 +12,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# URLs the interceptor rewrites (localhost variants with an explicit port).
+# Register the handler with this pattern so other requests never reach Python.
+ROUTE_URL_PATTERN = re.compile(
+    r"^https?://(?:localhost|127\.0\.0\.1|0\.0\.0\.0|\[::1\]):\d+"
+)
+
+# Localhost variants (incl. 0.0.0.0, which Vite uses) → host.docker.internal.
+# Compiled once per process and shared by every interceptor.
+_REWRITE_RE = re.compile(
+    r"(https?://)(?:\[::1\]|localhost|127\.0\.0\.1|0\.0\.0\.0)(:\d+)(.*)"
+)
+
 
 class RouteInterceptor:
     """Intercepts and redirects dev server requests.
@@ -24,39 +36,40 @@ class RouteInterceptor:
         self.config = config
         self.proxy_port = config.proxy.port
 
-        # Patterns to intercept (localhost variants → host.docker.internal)
-        self._patterns = [
-            # IPv6 localhost
-            (re.compile(r"(https?://)\[::1\](:\d+)(.*)"), r"\1host.docker.internal\2\3"),
-            # localhost
-            (re.compile(r"(https?://)localhost(:\d+)(.*)"), r"\1host.docker.internal\2\3"),
-            # 127.0.0.1
-            (re.compile(r"(https?://)127\.0\.0\.1(:\d+)(.*)"), r"\1host.docker.internal\2\3"),
-            # 0.0.0.0 (Vite uses this)
-            (re.compile(r"(https?://)0\.0\.0\.0(:\d+)(.*)"), r"\1host.docker.internal\2\3"),
-        ]
+        # If proxy is enabled, the Vite port is redirected to the proxy port
+        proxy = config.proxy
+        if proxy.enabled and proxy.vite_port:
+            self._vite_tok = f":{proxy.vite_port}"
+            self._proxy_tok = f":{self.proxy_port}"
+        else:
+            self._vite_tok = None
+            self._proxy_tok = None
 
     async def handle_route(self, route: Route) -> None:
         """Handle route interception."""
         url = route.request.url
 
-        for pattern, replacement in self._patterns:
-            if pattern.match(url):
-                new_url = pattern.sub(replacement, url)
-
-                # If proxy is enabled, redirect Vite port to proxy port
-                if self.config.proxy.enabled and self.config.proxy.vite_port:
-                    vite_port = self.config.proxy.vite_port
-                    new_url = new_url.replace(
-                        f":{vite_port}",
-                        f":{self.proxy_port}",
-                    )
-
-                logger.debug(f"Redirecting: {url} -> {new_url}")
-                await route.continue_(url=new_url)
-                return
-
-        await route.continue_()
+        # Cheap substring check first; only localhost candidates reach the regex
+        if (
+            "localhost" not in url
+            and "127.0.0.1" not in url
+            and "0.0.0.0" not in url
+            and "[::1]" not in url
+        ):
+            await route.continue_()
+            return
+
+        m = _REWRITE_RE.match(url)
+        if m is None:
+            await route.continue_()
+            return
+
+        new_url = f"{m[1]}host.docker.internal{m[2]}{m[3]}"
+        if self._vite_tok is not None:
+            new_url = new_url.replace(self._vite_tok, self._proxy_tok)
+
+        logger.debug("Redirecting: %s -> %s", url, new_url)
+        await route.continue_(url=new_url)
 
 
 def create_route_handler(config: ShaydeConfig):
@@ -2,18 +2,124 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import os
+import sys
+import weakref
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Action keys in the order they are checked when an action has several
+# (e.g. "goto" and "click" take an optional "wait" key of their own)
+_ACTION_PRIORITY = (
+    "goto",
+    "fill",
+    "click",
+    "select",
+    "upload",
+    "clear",
+    "type",
+    "login",
+    "logout",
+    "wait",
+    "accept_dialog",
+    "dismiss_dialog",
+)
+_ACTION_KEYS = frozenset(_ACTION_PRIORITY)
+
+# Actions that neither navigate nor depend on keyboard focus, so consecutive ones
+# on distinct selectors can run concurrently. fill/type/clear are excluded: they
+# focus the element and then send input, which interleaves when run together.
+_PARALLEL_ACTIONS = frozenset({"select", "upload"})
+
+
+def _is_relative_url(url: str) -> bool:
+    """Return True for URLs resolved against the base URL ("/path", "#hash")."""
+    return url[:1] in ("/", "#")
+
+
+def _is_url_path(target: str) -> bool:
+    """Return True if a wait target is a URL path rather than a CSS selector.
+
+    Only "/" counts here: "#id" is a selector.
+    """
+    return target[:1] == "/"
+
+
+@functools.lru_cache(maxsize=256)
+def _url_glob(path: str) -> str:
+    """Return the wait_for_url glob matching URLs that contain ``path``."""
+    return f"**{path}*"
+
+
+# Upload files already found on disk, keyed by (file_path, working directory)
+_found_uploads: Dict[Tuple[str, str], Path] = {}
+
+
+def _resolve_upload(file_path: str, base_dir: Optional[Path] = None) -> Tuple[Path, bool]:
+    """Return the absolute path of an upload file and whether it exists.
+
+    Relative paths are resolved against ``base_dir`` (default: the current
+    directory). Paths that were found are remembered; missing files are
+    checked again on every call so they can still appear later.
+    """
+    cwd = str(base_dir) if base_dir is not None else os.getcwd()
+    key = (file_path, cwd)
+    path = _found_uploads.get(key)
+    if path is not None:
+        return path, True
+
+    path = Path(file_path)
+    if not path.is_absolute():
+        # Resolve relative to the base (working) directory
+        path = Path(cwd) / path
+    if not path.exists():
+        return path, False
+
+    _found_uploads[key] = path
+    return path, True
+
+
+def _action_key(action: dict) -> Optional[str]:
+    """Return the key that determines how an action is executed."""
+    matched = _ACTION_KEYS & action.keys()
+    if matched:
+        for key in _ACTION_PRIORITY:
+            if key in matched:
+                return key
+    return None
+
+
+def _parallel_selector(action: Any) -> Optional[str]:
+    """Return the target selector if the action may run concurrently, else None.
+
+    Only actions marked ``parallel: true`` qualify; dependent controls such as
+    cascading selects must keep running in order.
+    """
+    if not isinstance(action, dict) or action.get("parallel") is not True:
+        return None
+    key = _action_key(action)
+    if key not in _PARALLEL_ACTIONS:
+        return None
+    payload = action[key]
+    if not isinstance(payload, dict):
+        return None
+    return payload.get("selector")
+
+
+@dataclass(**_SLOTS)
 class ActionResult:
     """Result of an action execution."""
     success: bool
@@ -26,8 +132,29 @@ class ActionResult:
 class ActionExecutor:
     """Execute Playwright actions from YAML definitions."""
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        keep_intermediate: bool = True,
+        base_dir: Optional[Path] = None,
+    ):
+        """Create an executor.
+
+        Args:
+            base_url: Base URL for relative goto URLs
+            keep_intermediate: Keep every sub-result of multi-actions in
+                ``data["results"]``; if False only the count and the error of
+                the failing action are kept
+            base_dir: Directory relative upload paths are resolved against
+                (defaults to the current directory)
+        """
         self.base_url = base_url
+        self.keep_intermediate = keep_intermediate
+        self.base_dir = base_dir
+        # Prefix for relative URLs ("/path", "#hash"), normalized once
+        self._base_prefix = base_url.rstrip("/") if base_url else "http://localhost"
+        # Pending accept/dismiss requests and the dialog listener serving them, per page
+        self._dialog_waiters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     async def execute(self, page: "Page", action: Union[dict, list[dict]]) -> ActionResult:
         """Execute action(s) defined in YAML.
@@ -49,90 +176,124 @@ class ActionExecutor:
 
     async def _execute_single(self, page: "Page", action: dict) -> ActionResult:
         """Execute a single action."""
-        # Determine action type and execute
-        if "goto" in action:
-            return await self.goto(page, action["goto"], action.get("wait"))
-
-        if "fill" in action:
-            fill_data = action["fill"]
-            if isinstance(fill_data, dict):
-                return await self.fill(page, fill_data["selector"], fill_data["value"])
-            # Simple fill: { fill: selector }
-            return ActionResult(
-                success=False,
-                action_type="fill",
-                error="Invalid fill format. Use: fill: { selector: '...', value: '...' }",
-            )
-
-        if "click" in action:
-            return await self.click(page, action["click"], action.get("wait"))
+        # Determine action type (first key in priority order) and execute
+        key = _action_key(action)
+        if key is not None:
+            return await _DISPATCH[key](self, page, action)
 
-        if "select" in action:
-            select_data = action["select"]
-            return await self.select(page, select_data["selector"], select_data["value"])
-
-        if "upload" in action:
-            upload_data = action["upload"]
-            return await self.upload(page, upload_data["selector"], upload_data["file"])
+        return ActionResult(
+            success=False,
+            action_type="unknown",
+            error=f"Unknown action: {', '.join(map(str, action))}",
+        )
 
-        if "clear" in action:
-            return await self.clear(page, action["clear"])
+    async def _run_goto(self, page: "Page", action: dict) -> ActionResult:
+        return await self.goto(page, action["goto"], action.get("wait"))
 
-        if "type" in action:
-            type_data = action["type"]
-            return await self.type_text(
-                page,
-                type_data["selector"],
-                type_data["value"],
-                type_data.get("delay", 0),
-            )
+    async def _run_fill(self, page: "Page", action: dict) -> ActionResult:
+        fill_data = action["fill"]
+        if isinstance(fill_data, dict):
+            return await self.fill(page, fill_data["selector"], fill_data["value"])
+        # Simple fill: { fill: selector }
+        return ActionResult(
+            success=False,
+            action_type="fill",
+            error="Invalid fill format. Use: fill: { selector: '...', value: '...' }",
+        )
 
-        if "login" in action:
-            # Login shortcut - will be handled by session
-            return ActionResult(
-                success=True,
-                action_type="login",
-                message=f"Login requested for account: {action['login']}",
-                data={"account": action["login"]},
-            )
+    async def _run_click(self, page: "Page", action: dict) -> ActionResult:
+        return await self.click(page, action["click"], action.get("wait"))
 
-        if "logout" in action:
-            return await self.logout(page)
+    async def _run_select(self, page: "Page", action: dict) -> ActionResult:
+        select_data = action["select"]
+        return await self.select(page, select_data["selector"], select_data["value"])
 
-        if "wait" in action:
-            return await self.wait(page, action["wait"])
+    async def _run_upload(self, page: "Page", action: dict) -> ActionResult:
+        upload_data = action["upload"]
+        return await self.upload(page, upload_data["selector"], upload_data["file"])
 
-        if "accept_dialog" in action:
-            return await self.handle_dialog(page, accept=True)
+    async def _run_clear(self, page: "Page", action: dict) -> ActionResult:
+        return await self.clear(page, action["clear"])
 
-        if "dismiss_dialog" in action:
-            return await self.handle_dialog(page, accept=False)
+    async def _run_type(self, page: "Page", action: dict) -> ActionResult:
+        type_data = action["type"]
+        return await self.type_text(
+            page,
+            type_data["selector"],
+            type_data["value"],
+            type_data.get("delay", 0),
+        )
 
+    async def _run_login(self, page: "Page", action: dict) -> ActionResult:
+        # Login shortcut - will be handled by session
         return ActionResult(
-            success=False,
-            action_type="unknown",
-            error=f"Unknown action: {list(action.keys())}",
+            success=True,
+            action_type="login",
+            message=f"Login requested for account: {action['login']}",
+            data={"account": action["login"]},
         )
 
+    async def _run_logout(self, page: "Page", action: dict) -> ActionResult:
+        return await self.logout(page)
+
+    async def _run_wait(self, page: "Page", action: dict) -> ActionResult:
+        return await self.wait(page, action["wait"])
+
+    async def _run_accept_dialog(self, page: "Page", action: dict) -> ActionResult:
+        return await self.handle_dialog(page, accept=True)
+
+    async def _run_dismiss_dialog(self, page: "Page", action: dict) -> ActionResult:
+        return await self.handle_dialog(page, accept=False)
+
     async def _execute_multi(self, page: "Page", actions: list[dict]) -> ActionResult:
-        """Execute multiple actions in sequence."""
+        """Execute multiple actions in sequence.
+
+        Consecutive select/upload actions marked ``parallel: true`` on distinct
+        selectors run concurrently.
+        """
         results = []
-        for i, action in enumerate(actions):
-            result = await self._execute_single(page, action)
-            results.append(result)
-            if not result.success:
-                return ActionResult(
-                    success=False,
-                    action_type="multi",
-                    error=f"Action {i + 1} failed: {result.error}",
-                    data={"results": results},
-                )
+        count = 0
+        i = 0
+        while i < len(actions):
+            # Group a run of independent actions; anything else runs alone
+            run = actions[i:i + 1]
+            selector = _parallel_selector(actions[i])
+            if selector is not None:
+                selectors = {selector}
+                for action in actions[i + 1:]:
+                    selector = _parallel_selector(action)
+                    if selector is None or selector in selectors:
+                        break
+                    selectors.add(selector)
+                    run.append(action)
+
+            if len(run) == 1:
+                chunk = [await self._execute_single(page, run[0])]
+            else:
+                chunk = await asyncio.gather(*(self._execute_single(page, a) for a in run))
+
+            for result in chunk:
+                count += 1
+                if self.keep_intermediate:
+                    results.append(result)
+                if not result.success:
+                    return ActionResult(
+                        success=False,
+                        action_type="multi",
+                        error=f"Action {count} failed: {result.error}",
+                        data=(
+                            {"results": results}
+                            if self.keep_intermediate
+                            else {"count": count, "last_error": result.error}
+                        ),
+                    )
+            i += len(run)
 
         return ActionResult(
             success=True,
             action_type="multi",
             message=f"Executed {len(actions)} actions",
-            data={"results": results},
+            data={"results": results} if self.keep_intermediate else {"count": count},
         )
 
     async def goto(
@@ -147,22 +308,19 @@ class ActionExecutor:
         """
         try:
             # Resolve URL
-            if url.startswith(("/", "#")):
-                if self.base_url:
-                    full_url = f"{self.base_url.rstrip('/')}{url}"
-                else:
-                    full_url = f"http://localhost{url}"
+            if _is_relative_url(url):
+                full_url = self._base_prefix + url
             else:
                 full_url = url
 
-            logger.info(f"Navigating to {full_url}")
+            logger.info("Navigating to %s", full_url)
             await page.goto(full_url, wait_until="networkidle")
 
             # Wait for additional condition
             if wait_for:
-                if wait_for.startswith("/"):
+                if _is_url_path(wait_for):
                     # Wait for URL
-                    await page.wait_for_url(f"**{wait_for}*", timeout=10000)
+                    await page.wait_for_url(_url_glob(wait_for), timeout=10000)
                 else:
                     # Wait for selector
                     await page.wait_for_selector(wait_for, timeout=10000)
@@ -175,7 +333,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Navigation failed: {e}")
+            logger.error("Navigation failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="goto",
@@ -191,7 +349,7 @@ class ActionExecutor:
             value: Value to fill
         """
         try:
-            logger.debug(f"Filling {selector} with '{value}'")
+            logger.debug("Filling %s with '%s'", selector, value)
             await page.fill(selector, value)
 
             return ActionResult(
@@ -202,7 +360,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Fill failed: {e}")
+            logger.error("Fill failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="fill",
@@ -220,14 +378,14 @@ class ActionExecutor:
             wait_for: Optional URL or selector to wait for after click
         """
         try:
-            logger.debug(f"Clicking {selector}")
+            logger.debug("Clicking %s", selector)
             await page.click(selector)
 
             # Wait for additional condition
             if wait_for:
-                if wait_for.startswith("/"):
+                if _is_url_path(wait_for):
                     # Wait for URL
-                    await page.wait_for_url(f"**{wait_for}*", timeout=10000)
+                    await page.wait_for_url(_url_glob(wait_for), timeout=10000)
                 else:
                     # Wait for selector
                     await page.wait_for_selector(wait_for, timeout=10000)
@@ -240,7 +398,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Click failed: {e}")
+            logger.error("Click failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="click",
@@ -256,7 +414,7 @@ class ActionExecutor:
             value: Option value or text
         """
         try:
-            logger.debug(f"Selecting '{value}' in {selector}")
+            logger.debug("Selecting '%s' in %s", value, selector)
             await page.select_option(selector, value)
 
             return ActionResult(
@@ -267,7 +425,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Select failed: {e}")
+            logger.error("Select failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="select",
@@ -283,19 +441,15 @@ class ActionExecutor:
             file_path: Path to file (relative to scenario directory)
         """
         try:
-            path = Path(file_path)
-            if not path.is_absolute():
-                # Resolve relative to current working directory
-                path = Path.cwd() / path
-
-            if not path.exists():
+            path, exists = _resolve_upload(file_path, self.base_dir)
+            if not exists:
                 return ActionResult(
                     success=False,
                     action_type="upload",
                     error=f"File not found: {path}",
                 )
 
-            logger.debug(f"Uploading {path} to {selector}")
+            logger.debug("Uploading %s to %s", path, selector)
             await page.set_input_files(selector, str(path))
 
             return ActionResult(
@@ -306,7 +460,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Upload failed: {e}")
+            logger.error("Upload failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="upload",
@@ -321,7 +475,7 @@ class ActionExecutor:
             selector: CSS selector
         """
         try:
-            logger.debug(f"Clearing {selector}")
+            logger.debug("Clearing %s", selector)
             await page.fill(selector, "")
 
             return ActionResult(
@@ -332,7 +486,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Clear failed: {e}")
+            logger.error("Clear failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="clear",
@@ -351,7 +505,7 @@ class ActionExecutor:
             delay: Delay between keystrokes in ms
         """
         try:
-            logger.debug(f"Typing into {selector}")
+            logger.debug("Typing into %s", selector)
             await page.type(selector, value, delay=delay)
 
             return ActionResult(
@@ -362,7 +516,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Type failed: {e}")
+            logger.error("Type failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="type",
@@ -376,12 +530,12 @@ class ActionExecutor:
             page: Playwright page
             target: URL pattern (starts with /), CSS selector, or duration in ms (int)
         """
-        import asyncio
-
         try:
-            # If target is a number, wait for that duration
-            if isinstance(target, (int, float)):
-                logger.debug(f"Waiting for {target}ms")
+            # If target is a number, wait for that duration (YAML yields exact
+            # int/float/bool types, so identity checks are enough)
+            target_type = type(target)
+            if target_type is int or target_type is float or target_type is bool:
+                logger.debug("Waiting for %sms", target)
                 await asyncio.sleep(target / 1000)
                 return ActionResult(
                     success=True,
@@ -391,11 +545,11 @@ class ActionExecutor:
                 )
 
             # String target: URL or selector
-            if target.startswith("/"):
-                logger.debug(f"Waiting for URL: {target}")
-                await page.wait_for_url(f"**{target}*", timeout=10000)
+            if _is_url_path(target):
+                logger.debug("Waiting for URL: %s", target)
+                await page.wait_for_url(_url_glob(target), timeout=10000)
             else:
-                logger.debug(f"Waiting for selector: {target}")
+                logger.debug("Waiting for selector: %s", target)
                 await page.wait_for_selector(target, timeout=10000)
 
             return ActionResult(
@@ -406,7 +560,7 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Wait failed: {e}")
+            logger.error("Wait failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="wait",
@@ -431,41 +585,79 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Logout failed: {e}")
+            logger.error("Logout failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type="logout",
                 error=str(e),
             )
 
+    def _add_dialog_waiter(self, page: "Page", accept: bool, future: asyncio.Future) -> None:
+        """Queue a dialog request, registering the page's listener if needed.
+
+        The listener only stays registered while requests are pending: a page
+        with a dialog listener no longer dismisses dialogs by itself, so an
+        idle one would leave unexpected dialogs open.
+        """
+        entry = self._dialog_waiters.get(page)
+        if entry is None:
+            waiters: Deque[Tuple[bool, asyncio.Future]] = deque()
+
+            async def on_dialog(dialog):
+                # Serve the oldest request still waiting
+                while waiters:
+                    accept, future = waiters.popleft()
+                    if future.done():  # Timed out
+                        continue
+                    # Unregister before awaiting so the next dialog is not
+                    # caught by an idle listener
+                    self._release_dialog_listener(page)
+                    try:
+                        if accept:
+                            await dialog.accept()
+                        else:
+                            await dialog.dismiss()
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result({"type": dialog.type, "message": dialog.message})
+                    return
+
+            page.on("dialog", on_dialog)
+            entry = self._dialog_waiters[page] = (waiters, on_dialog)
+
+        entry[0].append((accept, future))
+
+    def _release_dialog_listener(self, page: "Page") -> None:
+        """Remove the page's dialog listener once no request is pending."""
+        entry = self._dialog_waiters.get(page)
+        if entry is None:
+            return
+        waiters, listener = entry
+        if any(not future.done() for _, future in waiters):
+            return
+        del self._dialog_waiters[page]
+        page.remove_listener("dialog", listener)
+
     async def handle_dialog(self, page: "Page", accept: bool = True) -> ActionResult:
-        """Set up a one-time dialog handler.
+        """Accept or dismiss the next dialog on the page.
 
         Args:
             page: Playwright page
             accept: True to accept, False to dismiss
         """
-        import asyncio
-
         action_type = "accept_dialog" if accept else "dismiss_dialog"
-        dialog_handled = asyncio.Event()
-        dialog_info = {"type": None, "message": None}
-
-        async def one_time_handler(dialog):
-            dialog_info["type"] = dialog.type
-            dialog_info["message"] = dialog.message
-            if accept:
-                await dialog.accept()
-            else:
-                await dialog.dismiss()
-            dialog_handled.set()
-
-        page.once("dialog", one_time_handler)
+        future = asyncio.get_running_loop().create_future()
+        self._add_dialog_waiter(page, accept, future)
 
         try:
             # Wait for dialog with timeout
-            await asyncio.wait_for(dialog_handled.wait(), timeout=10.0)
-            logger.info(f"Dialog {action_type}: {dialog_info['type']} - {dialog_info['message']}")
+            dialog_info = await asyncio.wait_for(future, timeout=10.0)
+            logger.info(
+                "Dialog %s: %s - %s", action_type, dialog_info["type"], dialog_info["message"]
+            )
 
             return ActionResult(
                 success=True,
@@ -475,7 +667,7 @@ class ActionExecutor:
             )
 
         except asyncio.TimeoutError:
-            logger.warning(f"No dialog appeared within timeout for {action_type}")
+            logger.warning("No dialog appeared within timeout for %s", action_type)
             return ActionResult(
                 success=True,  # Not a failure, just no dialog
                 action_type=action_type,
@@ -483,9 +675,18 @@ class ActionExecutor:
             )
 
         except Exception as e:
-            logger.error(f"Dialog handling failed: {e}")
+            logger.error("Dialog handling failed: %s", e)
             return ActionResult(
                 success=False,
                 action_type=action_type,
                 error=str(e),
             )
+
+        finally:
+            self._release_dialog_listener(page)
+
+
+# Action key -> ActionExecutor adapter method
+_DISPATCH: Dict[str, Callable[[ActionExecutor, "Page", dict], Awaitable[ActionResult]]] = {
+    key: getattr(ActionExecutor, f"_run_{key}") for key in _ACTION_PRIORITY
+}
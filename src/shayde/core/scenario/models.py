@@ -9,6 +9,11 @@ from pathlib import Path
 from typing import Any, Optional
 
 
+# Per-step results appended during a run (one JSON object per line), so
+# progress survives a crash before results.json is written
+PROGRESS_FILENAME = "results.jsonl"
+
+
 class StepStatus(str, Enum):
     """Step execution status."""
     PENDING = "pending"
@@ -211,6 +216,42 @@ class StepExecutionResult:
             },
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> StepExecutionResult:
+        """Create from the dictionary produced by ``to_dict``."""
+        step = data["step"]
+        result = data["result"]
+        next_ = data["next"]
+        return cls(
+            session_id=data["session_id"],
+            step_id=step["id"],
+            step_desc=step["desc"],
+            part_num=step["part"],
+            part_title=step["part_title"],
+            result=StepResult(
+                step_id=step["id"],
+                desc=step["desc"],
+                status=StepStatus(result["status"]),
+                screenshot=Path(result["screenshot"]) if result["screenshot"] else None,
+                duration_ms=result["duration_ms"],
+                assertions=[
+                    AssertionResult(
+                        type=a["type"],
+                        expected=a["expected"],
+                        actual=None,
+                        passed=a["passed"],
+                    )
+                    for a in result["assertions"]
+                ],
+                error=result["error"],
+            ),
+            is_completed=next_["is_completed"],
+            is_part_change=next_["is_part_change"],
+            is_account_change=next_["is_account_change"],
+            next_part=next_["part"],
+            next_step=next_["step"],
+        )
+
 
 @dataclass
 class SessionEndResult:
@@ -244,6 +285,23 @@ class SessionEndResult:
             },
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> SessionEndResult:
+        """Create from the dictionary produced by ``to_dict``."""
+        result = data["result"]
+        output = data["output"]
+        return cls(
+            session_id=data["session_id"],
+            status=result["status"],
+            total_steps=result["total_steps"],
+            passed=result["passed"],
+            failed=result["failed"],
+            skipped=result["skipped"],
+            duration_ms=result["duration_ms"],
+            results_path=Path(output["results_json"]) if output["results_json"] else None,
+            video_path=Path(output["video"]) if output["video"] else None,
+        )
+
 
 @dataclass
 class SessionInfo:
@@ -278,3 +336,21 @@ class SessionInfo:
             "status": self.status,
             "created_at": self.created_at.isoformat(),
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SessionInfo:
+        """Create from the dictionary produced by ``to_dict``."""
+        scenario = data["scenario"]
+        current = data["current"]
+        return cls(
+            session_id=data["session_id"],
+            scenario_id=scenario["id"],
+            scenario_title=scenario["title"],
+            total_parts=scenario["total_parts"],
+            total_steps=scenario["total_steps"],
+            current_part=current["part"],
+            current_step_index=current["step"],
+            current_account=current["account"],
+            status=data["status"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
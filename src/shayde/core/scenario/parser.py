@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import pickle
 import re
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Mapping, Optional, Union
 
 import yaml
 
 from shayde.core.scenario.models import Priority, CoverageStatus
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
+# ${VAR} references expanded from the environment
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Parsed YAML of scenario files, reused across runs while the file is unchanged
+SCENARIO_CACHE_DIR = Path.home() / ".cache" / "shayde" / "scenarios"
+
 
 @dataclass
 class Account:
@@ -69,6 +85,7 @@ class Part:
     title: str
     account: Optional[str] = None
     items: list[Step] = field(default_factory=list)
+    parallel: bool = False
 
     @property
     def step_count(self) -> int:
@@ -84,6 +101,7 @@ class Part:
             "part": self.part,
             "title": self.title,
             "account": self.account,
+            "parallel": self.parallel,
             "items": [s.to_dict() for s in self.items],
         }
 
@@ -111,14 +129,29 @@ class Scenario:
     notes: list[str] = field(default_factory=list)
     test_files: list[dict] = field(default_factory=list)
     source_path: Optional[Path] = None
+    # (steps, screenshots), counted in one pass on first use; parts are not
+    # modified after parsing
+    _counts: Optional[tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _step_counts(self) -> tuple[int, int]:
+        if self._counts is None:
+            total_steps = total_screenshots = 0
+            for part in self.steps:
+                for step in part.items:
+                    total_steps += 1
+                    total_screenshots += step.has_screenshot
+            self._counts = (total_steps, total_screenshots)
+        return self._counts
 
     @property
     def total_steps(self) -> int:
-        return sum(p.step_count for p in self.steps)
+        return self._step_counts()[0]
 
     @property
     def total_screenshots(self) -> int:
-        return sum(p.screenshot_count for p in self.steps)
+        return self._step_counts()[1]
 
     def get_step(self, step_id: str) -> Optional[Step]:
         """Get step by ID."""
@@ -167,42 +200,130 @@ class Scenario:
         }
 
 
-def expand_env_vars(data: Any) -> Any:
+def expand_env_vars(data: Any, env: Optional[Mapping[str, str]] = None) -> Any:
     """Recursively expand ${VAR} patterns in data with environment variables.
 
     Args:
         data: Data structure (dict, list, or str)
+        env: Variables to expand from (defaults to ``os.environ``)
 
     Returns:
         Data with environment variables expanded
     """
+    if env is None:
+        env = os.environ
     if isinstance(data, str):
-        # Replace ${VAR} with os.environ.get('VAR', '')
-        pattern = re.compile(r'\$\{([^}]+)\}')
+        # Replace ${VAR} with env.get('VAR', '')
         def replacer(match):
             var_name = match.group(1)
-            return os.environ.get(var_name, '')
-        return pattern.sub(replacer, data)
+            return env.get(var_name, '')
+        return _ENV_VAR_RE.sub(replacer, data)
     elif isinstance(data, dict):
-        return {k: expand_env_vars(v) for k, v in data.items()}
+        return {k: expand_env_vars(v, env) for k, v in data.items()}
     elif isinstance(data, list):
-        return [expand_env_vars(item) for item in data]
+        return [expand_env_vars(item, env) for item in data]
     else:
         return data
 
 
+def referenced_env_vars(data: Any) -> set[str]:
+    """Return the names of all ${VAR} references in data.
+
+    Args:
+        data: Data structure (dict, list, or str)
+
+    Returns:
+        Set of variable names
+    """
+    names: set[str] = set()
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            names.update(_ENV_VAR_RE.findall(item))
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return names
+
+
+def load_scenario_yaml(path: Path) -> Any:
+    """Load a scenario YAML file, reusing a cached copy when unchanged.
+
+    The raw YAML data (before ``${VAR}`` expansion, so no environment values
+    are written to disk) is pickled under ``SCENARIO_CACHE_DIR`` keyed by the
+    file's path, mtime and size, and memoized for the current process. Only
+    the newest version of each file is kept on disk.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Loaded YAML data
+    """
+    path = path.resolve()
+    stat = path.stat()
+    return _load_scenario_yaml_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_scenario_yaml_cached(path: Path, mtime_ns: int, size: int) -> Any:
+    """Load YAML via the on-disk cache (cached by ``load_scenario_yaml``)."""
+    # "<path hash>-<version>.pkl": older versions of a file share the prefix
+    prefix = hashlib.sha1(str(path).encode()).hexdigest()
+    cache_file = SCENARIO_CACHE_DIR / f"{prefix}-{mtime_ns}-{size}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+
+    # Binary stream: libyaml reads and decodes it through its own buffer
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+
+    try:
+        SCENARIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=SCENARIO_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        # Drop cached copies of earlier versions of this file
+        for stale in SCENARIO_CACHE_DIR.glob(f"{prefix}-*.pkl"):
+            if stale != cache_file:
+                stale.unlink()
+    except OSError:
+        pass
+
+    return data
+
+
 class ScenarioParser:
     """YAML scenario parser."""
 
-    def __init__(self):
+    def __init__(self, env: Optional[Mapping[str, str]] = None):
+        """Create a parser.
+
+        Args:
+            env: Variables for ``${VAR}`` expansion (defaults to ``os.environ``)
+        """
+        self.env = env
         self.errors: list[str] = []
         self.warnings: list[str] = []
 
-    def parse(self, path: Path) -> Scenario:
+    def parse(self, path: Path, part: Optional[int] = None) -> Scenario:
         """Parse scenario from YAML file.
 
         Args:
             path: Path to YAML file
+            part: If given, only this part is expanded and built; the
+                scenario's steps hold just that part
 
         Returns:
             Parsed Scenario object
@@ -213,19 +334,46 @@ class ScenarioParser:
         self.errors = []
         self.warnings = []
 
+        return self._parse_scenario(self._load(path, part), path)
+
+    def parse_and_validate(self, path: Path) -> tuple[Scenario, list[str], list[str]]:
+        """Parse and validate a scenario file in a single pass over its steps.
+
+        Args:
+            path: Path to YAML file
+
+        Returns:
+            Tuple of (scenario, errors, warnings); the same checks as
+            ``validate`` are applied while the parts are built
+
+        Raises:
+            ValueError: If parsing fails
+        """
+        self.errors = []
+        self.warnings = []
+
+        scenario = self._parse_scenario(self._load(path), path, validate=True)
+        return scenario, self.errors, self.warnings
+
+    def _load(self, path: Path, part: Optional[int] = None) -> Any:
+        """Load and env-expand scenario data, optionally keeping one part."""
         if not path.exists():
             raise ValueError(f"Scenario file not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_scenario_yaml(path)
 
         if not data:
             raise ValueError(f"Empty scenario file: {path}")
 
-        # Expand environment variables in the data
-        data = expand_env_vars(data)
+        if part is not None and isinstance(data, dict):
+            # Shallow copy: the loaded data is shared through the YAML cache
+            data = dict(data)
+            data["steps"] = [
+                p for p in data.get("steps") or [] if p.get("part", 0) == part
+            ]
 
-        return self._parse_scenario(data, path)
+        # Expand environment variables in the data
+        return expand_env_vars(data, self.env)
 
     def parse_string(self, content: str) -> Scenario:
         """Parse scenario from YAML string.
@@ -239,14 +387,20 @@ class ScenarioParser:
         self.errors = []
         self.warnings = []
 
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_SafeLoader)
         if not data:
             raise ValueError("Empty scenario content")
 
         return self._parse_scenario(data, None)
 
-    def _parse_scenario(self, data: dict, source_path: Optional[Path]) -> Scenario:
-        """Parse scenario from dictionary."""
+    def _parse_scenario(
+        self, data: dict, source_path: Optional[Path], validate: bool = False
+    ) -> Scenario:
+        """Parse scenario from dictionary.
+
+        With ``validate``, problems are collected into ``self.errors`` and
+        ``self.warnings`` as the scenario is built.
+        """
         # Version
         version = data.get("version", 1)
 
@@ -259,6 +413,8 @@ class ScenarioParser:
             estimated_time=meta_data.get("estimated_time"),
             depends_on=meta_data.get("depends_on", []),
         )
+        if validate:
+            self._check_meta(meta, self.errors, self.warnings)
 
         # Prerequisites
         prerequisites = data.get("prerequisites", [])
@@ -284,9 +440,14 @@ class ScenarioParser:
 
         # Steps (Parts)
         steps = []
+        step_ids: set[str] = set()
         for part_data in data.get("steps", []):
             part = self._parse_part(part_data)
+            if validate:
+                self._check_part(part, accounts, step_ids, self.errors, self.warnings)
             steps.append(part)
+        if validate and not steps:
+            self.errors.append("No steps defined")
 
         # Pass criteria
         pass_criteria = data.get("pass_criteria", [])
@@ -322,6 +483,7 @@ class ScenarioParser:
             title=data.get("title", ""),
             account=data.get("account"),
             items=items,
+            parallel=bool(data.get("parallel", False)),
         )
 
     def _parse_step(self, data: dict) -> Step:
@@ -343,46 +505,58 @@ class ScenarioParser:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        errors = []
-        warnings = []
+        errors: list[str] = []
+        warnings: list[str] = []
 
-        # Check meta
-        if not scenario.meta.id:
-            errors.append("Missing meta.id")
-        if not scenario.meta.title:
-            warnings.append("Missing meta.title")
+        self._check_meta(scenario.meta, errors, warnings)
 
         # Check steps
         if not scenario.steps:
             errors.append("No steps defined")
 
-        # Check step IDs are unique
-        step_ids = set()
+        step_ids: set[str] = set()
         for part in scenario.steps:
-            for step in part.items:
-                if step.id in step_ids:
-                    errors.append(f"Duplicate step ID: {step.id}")
-                step_ids.add(step.id)
-
-        # Check account references
-        for part in scenario.steps:
-            if part.account and part.account not in scenario.accounts:
-                warnings.append(
-                    f"Part {part.part} references undefined account: {part.account}"
-                )
-
-            for step in part.items:
-                # Check login action references
-                if step.action and isinstance(step.action, dict):
-                    login_account = step.action.get("login")
-                    if login_account and login_account not in scenario.accounts:
-                        warnings.append(
-                            f"Step {step.id} references undefined account: {login_account}"
-                        )
+            self._check_part(part, scenario.accounts, step_ids, errors, warnings)
 
         is_valid = len(errors) == 0
         return is_valid, errors, warnings
 
+    def _check_meta(self, meta: Meta, errors: list[str], warnings: list[str]) -> None:
+        """Check scenario metadata."""
+        if not meta.id:
+            errors.append("Missing meta.id")
+        if not meta.title:
+            warnings.append("Missing meta.title")
+
+    def _check_part(
+        self,
+        part: Part,
+        accounts: dict[str, Account],
+        step_ids: set[str],
+        errors: list[str],
+        warnings: list[str],
+    ) -> None:
+        """Check one part; ``step_ids`` collects IDs seen so far."""
+        # Check account references
+        if part.account and part.account not in accounts:
+            warnings.append(
+                f"Part {part.part} references undefined account: {part.account}"
+            )
+
+        for step in part.items:
+            # Check step IDs are unique
+            if step.id in step_ids:
+                errors.append(f"Duplicate step ID: {step.id}")
+            step_ids.add(step.id)
+
+            # Check login action references
+            if step.action and isinstance(step.action, dict):
+                login_account = step.action.get("login")
+                if login_account and login_account not in accounts:
+                    warnings.append(
+                        f"Step {step.id} references undefined account: {login_account}"
+                    )
+
 
 def sanitize_filename(text: str, max_length: int = 50) -> str:
     """Sanitize text for use in filename.
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional
 
 from shayde.core.scenario.models import (
+    PROGRESS_FILENAME,
     PartResult,
     ScenarioResult,
     StepResult,
@@ -31,20 +32,72 @@ class ReportGenerator:
         Returns:
             ScenarioResult object
 
+        If the run was interrupted before results.json was (re)written, the
+        steps recorded in the results.jsonl progress log are used instead.
+
         Raises:
-            FileNotFoundError: If results.json not found
+            FileNotFoundError: If neither results.json nor results.jsonl exists
             ValueError: If JSON is invalid
         """
         results_path = self.results_dir / "results.json"
-        if not results_path.exists():
-            raise FileNotFoundError(f"Results file not found: {results_path}")
+        progress_path = self.results_dir / PROGRESS_FILENAME
+
+        data: dict = {}
+        if results_path.exists():
+            with open(results_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
-        with open(results_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if progress_path.exists() and (
+            not data or progress_path.stat().st_mtime_ns > results_path.stat().st_mtime_ns
+        ):
+            data = self._merge_progress(data, progress_path)
+
+        if not data:
+            raise FileNotFoundError(f"Results file not found: {results_path}")
 
         self.results = self._parse_results(data)
         return self.results
 
+    def _merge_progress(self, data: dict, progress_path: Path) -> dict:
+        """Overlay parts from an unfinished run's progress log onto results data."""
+        parts: dict = {}
+        with open(progress_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half-written
+                    continue
+                data.setdefault("scenario_id", record["scenario_id"])
+                data.setdefault("title", record["title"])
+                data.setdefault("started_at", record.get("started_at"))
+                part = parts.setdefault(record["part"], {
+                    "part": record["part"],
+                    "title": record["part_title"],
+                    "steps": [],
+                })
+                part["steps"].append(record["step"])
+
+        if not parts:
+            return data
+
+        for part in parts.values():
+            failed = any(s["status"] == "failed" for s in part["steps"])
+            part["status"] = "failed" if failed else "passed"
+
+        merged = [p for p in data.get("parts", []) if p["part"] not in parts]
+        merged.extend(parts.values())
+        merged.sort(key=lambda p: p["part"])
+
+        data = dict(data, parts=merged, completed_at=None)
+        if any(p["status"] == "failed" for p in merged):
+            data["status"] = "failed"
+        else:
+            data["status"] = "running"
+        return data
+
     def _parse_results(self, data: dict) -> ScenarioResult:
         """Parse results from JSON data."""
         parts = []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -28,6 +29,7 @@ class ScenarioRunner:
     - Screenshot capture at checkpoints
     - Account switching between parts
     - Progress callbacks for UI updates
+    - Concurrent execution of parts marked ``parallel: true``
     """
 
     def __init__(
@@ -37,9 +39,16 @@ class ScenarioRunner:
         on_step_complete: Optional[Callable[[Step, StepResult], None]] = None,
         on_part_start: Optional[Callable[[Part], None]] = None,
         on_part_complete: Optional[Callable[[Part], None]] = None,
+        concurrency: int = 1,
     ):
         self.session = session
-        self.action_executor = ActionExecutor(base_url=session.base_url)
+        self.concurrency = max(1, concurrency)
+        # Step results only record success and error, not multi-action sub-results
+        self.action_executor = ActionExecutor(
+            base_url=session.base_url,
+            keep_intermediate=False,
+            base_dir=session.base_dir,
+        )
         self.assertion_executor = AssertionExecutor()
 
         # Callbacks
@@ -79,12 +88,15 @@ class ScenarioRunner:
                             break
 
                 # Run steps
-                for step in part.items:
-                    result = await self.run_step(step, part)
-
-                    if result.status == StepStatus.FAILED and stop_on_error:
-                        logger.error(f"Step {step.id} failed, stopping execution")
-                        break
+                if self._can_run_parallel(part):
+                    await self.run_part_parallel(part)
+                else:
+                    for step in part.items:
+                        result = await self.run_step(step, part)
+
+                        if result.status == StepStatus.FAILED and stop_on_error:
+                            logger.error(f"Step {step.id} failed, stopping execution")
+                            break
 
                 self.session.finish_part()
 
@@ -119,6 +131,85 @@ class ScenarioRunner:
         if self.on_step_start:
             self.on_step_start(step, part)
 
+        page = await self.session.get_page()
+        result = await self._execute_step(step, part, page)
+
+        self.session.record_step_result(result)
+
+        if self.on_step_complete:
+            self.on_step_complete(step, result)
+
+        return result
+
+    async def run_part_parallel(self, part: Part) -> list[StepResult]:
+        """Run a part's steps concurrently, each on its own page.
+
+        At most ``concurrency`` steps run at once. Pages share the session
+        context (and so its login). Results are recorded and reported in
+        step order once all steps have finished.
+
+        Args:
+            part: Part whose steps are independent of each other
+
+        Returns:
+            StepResults in step order
+        """
+        logger.info(f"Running part {part.part} with concurrency {self.concurrency}")
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(step: Step) -> StepResult:
+            async with semaphore:
+                page = await self.session.new_page()
+                try:
+                    return await self._execute_step(step, part, page)
+                finally:
+                    await page.close()
+
+        results = await asyncio.gather(*[run_one(step) for step in part.items])
+
+        for step, result in zip(part.items, results):
+            if self.on_step_start:
+                self.on_step_start(step, part)
+            self.session.record_step_result(result)
+            if self.on_step_complete:
+                self.on_step_complete(step, result)
+
+        return results
+
+    def _can_run_parallel(self, part: Part) -> bool:
+        """Check whether a part may run its steps concurrently."""
+        if not part.parallel or self.concurrency < 2:
+            return False
+
+        # Video records a single page, and login/logout change the shared account
+        if self.session.record_video:
+            logger.warning(f"Part {part.part}: parallel steps disabled while recording video")
+            return False
+
+        for step in part.items:
+            actions = step.action if isinstance(step.action, list) else [step.action]
+            if any(
+                isinstance(a, dict) and ("login" in a or "logout" in a)
+                for a in actions
+            ):
+                logger.warning(
+                    f"Part {part.part}: step {step.id} switches account, running sequentially"
+                )
+                return False
+
+        return True
+
+    async def _execute_step(self, step: Step, part: Part, page: "Page") -> StepResult:
+        """Execute a step's action, assertions and screenshot on a page.
+
+        Args:
+            step: Step to execute
+            part: Part containing the step
+            page: Page to run the step on
+
+        Returns:
+            StepResult (not yet recorded in the session)
+        """
         result = StepResult(
             step_id=step.id,
             desc=step.desc,
@@ -126,8 +217,6 @@ class ScenarioRunner:
             started_at=datetime.now(),
         )
 
-        page = await self.session.get_page()
-
         try:
             # Execute action
             if step.action:
@@ -138,8 +227,8 @@ class ScenarioRunner:
                     logger.error(f"Action failed: {action_result.error}")
 
                 # Inject platform CSS and cursor highlight after navigation
-                await self.session.inject_platform_css()
-                await self.session.inject_cursor_highlight()
+                await self.session.inject_platform_css(page)
+                await self.session.inject_cursor_highlight(page)
 
                 # Handle login action (account switch)
                 if action_result.data and action_result.data.get("account"):
@@ -181,11 +270,6 @@ class ScenarioRunner:
             (result.completed_at - result.started_at).total_seconds() * 1000
         )
 
-        self.session.record_step_result(result)
-
-        if self.on_step_complete:
-            self.on_step_complete(step, result)
-
         return result
 
     async def run_single_step(self, step_id: str) -> Optional[StepResult]:
@@ -231,6 +315,7 @@ async def run_scenario(
     stop_on_error: bool = False,
     part_filter: Optional[int] = None,
     record_video: bool = False,
+    concurrency: int = 1,
 ) -> ScenarioSession:
     """Run a scenario from YAML file.
 
@@ -241,6 +326,7 @@ async def run_scenario(
         stop_on_error: Stop on first error
         part_filter: Run only specific part
         record_video: Record video of execution
+        concurrency: Maximum concurrent steps in parts marked ``parallel: true``
 
     Returns:
         ScenarioSession with results
@@ -254,9 +340,11 @@ async def run_scenario(
     parser = ScenarioParser()
     scenario = parser.parse(scenario_path)
 
-    # Filter parts if requested
+    # Filter parts if requested (on a copy; parsed scenarios are not modified)
     if part_filter is not None:
-        scenario.steps = [p for p in scenario.steps if p.part == part_filter]
+        scenario = dataclasses.replace(
+            scenario, steps=[p for p in scenario.steps if p.part == part_filter]
+        )
 
     # Load config and determine base URL
     config = load_config()
@@ -314,6 +402,7 @@ async def run_scenario(
             on_step_start=on_step_start,
             on_step_complete=on_step_complete,
             on_part_start=on_part_start,
+            concurrency=concurrency,
         )
 
         # Run scenario
@@ -12,15 +12,17 @@ from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from playwright.async_api import Browser, BrowserContext, Page
+    from shayde.config.schema import ShaydeConfig
 
 from shayde.core.scenario.models import (
+    PROGRESS_FILENAME,
     PartResult,
     ScenarioResult,
     StepResult,
     StepStatus,
 )
 from shayde.core.scenario.parser import Account, Part, Scenario, sanitize_filename
-from shayde.core.routes import create_route_handler
+from shayde.core.routes import ROUTE_URL_PATTERN, create_route_handler
 from shayde.config.loader import load_config
 from shayde.proxy.manager import ProxyManager
 from shayde.docker.manager import PLATFORM_CSS
@@ -114,12 +116,17 @@ class ScenarioSession:
         browser: "Browser",
         base_url: Optional[str] = None,
         record_video: bool = False,
+        config: Optional["ShaydeConfig"] = None,
+        base_dir: Optional[Path] = None,
     ):
         self.scenario = scenario
         self.output_dir = output_dir
         self.browser = browser
         self.base_url = base_url
         self.record_video = record_video
+        # Config and working directory of the caller (default: this process)
+        self.config = config
+        self.base_dir = base_dir
 
         self.session_id = str(uuid.uuid4())[:8]
         self.current_account: Optional[str] = None
@@ -137,6 +144,8 @@ class ScenarioSession:
         self._proxy_manager: Optional[ProxyManager] = None
         self._platform_css: Optional[str] = None
         self._video_dir: Optional[Path] = None
+        self._route_handler = None
+        self._auto_accept_dialogs = False
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -146,7 +155,7 @@ class ScenarioSession:
         logger.info(f"Setting up session {self.session_id}")
 
         # Load config and start proxy if enabled
-        config = load_config()
+        config = self.config or load_config()
         if config.proxy.enabled:
             self._proxy_manager = ProxyManager(config)
             await self._proxy_manager.start()
@@ -167,23 +176,17 @@ class ScenarioSession:
         self.context = await self.browser.new_context(**context_options)
         # Set default timeout to 10 seconds (Playwright default is 30s)
         self.context.set_default_timeout(10000)
-        self.page = await self.context.new_page()
-
-        # Auto-accept dialogs if configured (default: true)
-        if config.dialog.auto_accept:
-            async def handle_dialog(dialog):
-                logger.info(f"Dialog auto-accepted: {dialog.type} - {dialog.message}")
-                await dialog.accept()
-            self.page.on("dialog", handle_dialog)
-
-        # Set up route interception for Docker → host redirection
-        route_handler = create_route_handler(config)
-        await self.page.route("**/*", route_handler)
+        self._auto_accept_dialogs = config.dialog.auto_accept
+        self._route_handler = create_route_handler(config)
+        self.page = await self.new_page()
 
         # Store platform CSS for injection after navigation
         self._platform_css = PLATFORM_CSS.get(config.fonts.platform, PLATFORM_CSS["neutral"])
         logger.info(f"Platform font: {config.fonts.platform}")
 
+        # Start a fresh progress log for this run
+        (self.output_dir / PROGRESS_FILENAME).write_text("", encoding="utf-8")
+
         self.result.started_at = datetime.now()
 
     async def teardown(self) -> None:
@@ -300,27 +303,48 @@ class ScenarioSession:
             logger.error(f"Login error: {e}")
             return False
 
+    async def new_page(self) -> "Page":
+        """Open a page in the session context with dialog and route handling.
+
+        Pages share the context's cookies, so they are logged in as the
+        current account.
+        """
+        page = await self.context.new_page()
+
+        # Auto-accept dialogs if configured (default: true)
+        if self._auto_accept_dialogs:
+            async def handle_dialog(dialog):
+                logger.info(f"Dialog auto-accepted: {dialog.type} - {dialog.message}")
+                await dialog.accept()
+            page.on("dialog", handle_dialog)
+
+        # Set up route interception for Docker → host redirection
+        await page.route(ROUTE_URL_PATTERN, self._route_handler)
+        return page
+
     async def get_page(self) -> "Page":
         """Get current page, ensuring session is set up."""
         if not self.page:
             await self.setup()
         return self.page
 
-    async def inject_platform_css(self) -> None:
-        """Inject platform-specific font CSS into the current page.
+    async def inject_platform_css(self, page: Optional["Page"] = None) -> None:
+        """Inject platform-specific font CSS into a page (default: the current page).
 
         Call this after page navigation to apply Mac/Windows fonts.
         """
-        if self._platform_css and self.page:
-            await self.page.add_style_tag(content=self._platform_css)
+        page = page or self.page
+        if self._platform_css and page:
+            await page.add_style_tag(content=self._platform_css)
 
-    async def inject_cursor_highlight(self) -> None:
+    async def inject_cursor_highlight(self, page: Optional["Page"] = None) -> None:
         """Inject cursor highlight script for video recording.
 
         Call this after page navigation to show mouse cursor and click effects.
         """
-        if self.record_video and self.page:
-            await self.page.evaluate(CURSOR_HIGHLIGHT_SCRIPT)
+        page = page or self.page
+        if self.record_video and page:
+            await page.evaluate(CURSOR_HIGHLIGHT_SCRIPT)
 
     def get_screenshot_path(
         self,
@@ -372,6 +396,7 @@ class ScenarioSession:
         """
         if self._current_part_result:
             self._current_part_result.steps.append(result)
+            self._append_progress(result)
 
             # Update part status
             if result.status == StepStatus.FAILED:
@@ -380,6 +405,22 @@ class ScenarioSession:
                 if self._current_part_result.status != StepStatus.FAILED:
                     self._current_part_result.status = StepStatus.PASSED
 
+    def _append_progress(self, result: StepResult) -> None:
+        """Append a step result to the run's progress log."""
+        record = {
+            "scenario_id": self.result.scenario_id,
+            "title": self.result.title,
+            "started_at": self.result.started_at.isoformat() if self.result.started_at else None,
+            "part": self._current_part_result.part,
+            "part_title": self._current_part_result.title,
+            "step": result.to_dict(),
+        }
+        try:
+            with open(self.output_dir / PROGRESS_FILENAME, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write progress log: {e}")
+
     def finish_part(self) -> None:
         """Finish current part."""
         if self._current_part_result:
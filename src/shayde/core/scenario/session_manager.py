@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Mapping, Optional
 
 if TYPE_CHECKING:
     from playwright.async_api import Browser
@@ -20,7 +21,7 @@ from shayde.core.scenario.models import (
     StepResult,
     StepStatus,
 )
-from shayde.core.scenario.parser import Part, Scenario, Step, parse_scenario
+from shayde.core.scenario.parser import Part, Scenario, ScenarioParser, Step
 from shayde.core.scenario.runner import ScenarioRunner
 from shayde.core.scenario.session import ScenarioSession
 from shayde.config.loader import load_config
@@ -99,6 +100,8 @@ class SessionManager:
         base_url: Optional[str] = None,
         record_video: bool = True,
         start_part: int = 1,
+        base_dir: Optional[Path] = None,
+        env: Optional[Mapping[str, str]] = None,
     ) -> SessionInfo:
         """Create a new step-by-step session.
 
@@ -108,6 +111,12 @@ class SessionManager:
             base_url: Base URL override
             record_video: Whether to record video
             start_part: Part number to start from (1-indexed)
+            base_dir: Working directory of the caller: config is loaded for
+                it and relative paths (scenario, uploads, default output
+                directory) resolve against it (defaults to the current
+                directory)
+            env: Environment for ``${VAR}`` expansion (defaults to this
+                process's environment)
 
         Returns:
             SessionInfo with session details
@@ -115,21 +124,29 @@ class SessionManager:
         session_id = str(uuid.uuid4())[:8]
         logger.info(f"Creating session {session_id} for {yaml_path}")
 
+        base_dir = Path(base_dir).resolve() if base_dir is not None else Path.cwd()
+        yaml_path = base_dir / yaml_path
+
         # Parse scenario
-        scenario = parse_scenario(yaml_path)
+        scenario = ScenarioParser(env=env).parse(yaml_path)
 
         # Load config and connect browser
-        config = load_config()
-        browser_manager = BrowserManager(config)
-        await browser_manager.connect()
-        browser = browser_manager.browser
+        from shayde.docker.manager import DockerManager
+
+        config = load_config(project_dir=base_dir)
+        docker_manager = DockerManager(config)
+        if config.docker.auto_start:
+            # Blocking (docker CLI, health polling): keep the event loop free
+            await asyncio.get_running_loop().run_in_executor(None, docker_manager.start)
 
-        if not browser:
-            raise RuntimeError("Failed to connect to browser")
+        browser_manager = BrowserManager(docker_manager.get_ws_url())
+        browser = await browser_manager.connect()
 
         # Determine output directory
         if output_dir is None:
-            output_dir = Path(f"screenshots/{scenario.meta.id}_{scenario.meta.title}")
+            output_dir = base_dir / f"screenshots/{scenario.meta.id}_{scenario.meta.title}"
+        else:
+            output_dir = base_dir / output_dir
 
         # Create scenario session
         scenario_session = ScenarioSession(
@@ -138,6 +155,8 @@ class SessionManager:
             browser=browser,
             base_url=base_url,
             record_video=record_video,
+            config=config,
+            base_dir=base_dir,
         )
 
         # Initialize session (creates browser context)
@@ -299,15 +318,17 @@ class SessionManager:
         # Save results
         results_path = managed.session.save_results()
 
-        # Get video path if recording
+        # Close the context (finalizing any video) and the browser connection;
+        # a server hosting many sessions would otherwise leak both
         video_path: Optional[Path] = None
-        if managed.session.record_video and managed.session.context:
-            try:
-                # Close context to finalize video
-                await managed.session.teardown()
-                video_path = managed.session.video_path
-            except Exception as e:
-                logger.error(f"Error saving video: {e}")
+        try:
+            await managed.session.teardown()
+            if managed.session.record_video and managed.session.result:
+                video_path = managed.session.result.video_path
+        except Exception as e:
+            logger.error(f"Error saving video: {e}")
+        finally:
+            await managed.browser_manager.disconnect()
 
         # Calculate totals
         total_steps = managed.get_total_steps()
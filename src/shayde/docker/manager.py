@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import shutil
@@ -87,6 +88,17 @@ def get_package_docker_dir() -> Path:
     return package_dir
 
 
+# How long a "container is running" result is trusted without asking Docker
+CONTAINER_STATE_TTL = 5.0
+
+
+def _container_state_file() -> Path:
+    """Path of the file caching the last positive container check."""
+    from shayde.config.loader import GLOBAL_CONFIG_DIR
+
+    return GLOBAL_CONFIG_DIR / "container_state.json"
+
+
 class DockerManager:
     """Manages Docker Playwright container lifecycle."""
 
@@ -95,6 +107,8 @@ class DockerManager:
         self._compose_file: Optional[Path] = None
         self._docker_bin = self._find_docker()
         self._platform: Optional[str] = None
+        # May be switched off at runtime if the custom image fails to build
+        self._use_custom_image = config.docker.use_custom_image
 
     def _find_docker(self) -> str:
         """Find Docker binary."""
@@ -162,7 +176,7 @@ class DockerManager:
 
     def _get_image_name(self) -> str:
         """Get the Docker image name to use."""
-        if self.config.docker.use_custom_image:
+        if self._use_custom_image:
             return f"{self.config.docker.image_name}:latest"
         return f"mcr.microsoft.com/playwright:v{self.config.docker.playwright_version}-noble"
 
@@ -237,7 +251,7 @@ class DockerManager:
 
     def is_image_built(self) -> bool:
         """Check if custom image is built."""
-        if not self.config.docker.use_custom_image:
+        if not self._use_custom_image:
             return True
 
         result = self._run_docker(
@@ -248,7 +262,7 @@ class DockerManager:
 
     def build_image(self, force: bool = False) -> bool:
         """Build the custom Shayde Docker image with fonts."""
-        if not self.config.docker.use_custom_image:
+        if not self._use_custom_image:
             logger.info("Custom image disabled, using official Playwright image")
             return True
 
@@ -289,6 +303,42 @@ class DockerManager:
         )
         return bool(result.stdout.strip())
 
+    def is_container_running_cached(self, ttl: float = CONTAINER_STATE_TTL) -> bool:
+        """Check if the container is running, trusting a recent positive result.
+
+        A result cached less than ``ttl`` seconds ago is reused as long as the
+        Playwright port still accepts connections, which is much cheaper than
+        asking Docker. Otherwise falls back to ``is_container_running``.
+        """
+        state_file = _container_state_file()
+        name = self.config.docker.container_name
+        port = self.config.docker.ws_port
+        try:
+            state = json.loads(state_file.read_text(encoding="utf-8"))
+            fresh = (
+                state.get("container_name") == name
+                and state.get("ws_port") == port
+                and 0 <= time.time() - state.get("ts", 0) < ttl
+            )
+        except (OSError, ValueError, AttributeError, TypeError):
+            fresh = False
+        if fresh and self._check_playwright_ready():
+            return True
+
+        running = self.is_container_running()
+        try:
+            if running:
+                state_file.parent.mkdir(parents=True, exist_ok=True)
+                state_file.write_text(
+                    json.dumps({"container_name": name, "ws_port": port, "ts": time.time()}),
+                    encoding="utf-8",
+                )
+            else:
+                state_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return running
+
     def start(self) -> bool:
         """Start the Playwright container."""
         # Ensure Docker is running
@@ -296,11 +346,11 @@ class DockerManager:
             return False
 
         # Build custom image if needed
-        if self.config.docker.use_custom_image:
+        if self._use_custom_image:
             if not self.build_image():
                 logger.warning("Failed to build custom image, falling back to official image")
                 # Temporarily disable custom image
-                self.config.docker.use_custom_image = False
+                self._use_custom_image = False
 
         # Check if already running
         if self.is_container_running():
@@ -348,6 +398,10 @@ class DockerManager:
             return True
 
         logger.info(f"Stopping container {self.config.docker.container_name}...")
+        try:
+            _container_state_file().unlink(missing_ok=True)
+        except OSError:
+            pass
         result = self._run_docker(
             "stop", self.config.docker.container_name,
             check=False,
@@ -1,6 +1,20 @@
 """Shayde server module for persistent browser connection."""
 
-from shayde.server.app import ShaydeServer
-from shayde.server.client import ShaydeClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from shayde.server.app import ShaydeServer
+    from shayde.server.client import ShaydeClient
 
 __all__ = ["ShaydeServer", "ShaydeClient"]
+
+
+def __getattr__(name: str):
+    """Import the server and client (and aiohttp) only when first used."""
+    if name == "ShaydeServer":
+        from shayde.server.app import ShaydeServer
+        return ShaydeServer
+    if name == "ShaydeClient":
+        from shayde.server.client import ShaydeClient
+        return ShaydeClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,21 +8,24 @@ import logging
 import os
 import signal
 import sys
-from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from aiohttp import web
-from playwright.async_api import async_playwright, Browser, Playwright
+
+from shayde.server.state import (  # noqa: F401 - re-exported
+    DEFAULT_PORT,
+    PID_FILE,
+    SOCKET_FILE,
+    get_pid,
+    is_running,
+    signal_ready,
+)
 
 if TYPE_CHECKING:
-    pass
+    from playwright.async_api import Browser, Playwright
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_PORT = 9876
-PID_FILE = Path("/tmp/shayde-server.pid")
-SOCKET_FILE = Path("/tmp/shayde-server.sock")
-
 
 class ShaydeServer:
     """HTTP server that maintains persistent Playwright connection."""
@@ -34,14 +37,23 @@ class ShaydeServer:
         self._browser: Optional[Browser] = None
         self._app: Optional[web.Application] = None
         self._runner: Optional[web.AppRunner] = None
+        self._browser_lock = asyncio.Lock()
+        self._stop_event: Optional[asyncio.Event] = None
 
     async def _ensure_browser(self) -> Browser:
         """Ensure browser connection is established."""
-        if self._browser is None or not self._browser.is_connected():
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.connect(self.ws_url)
-            logger.info(f"Connected to Playwright at {self.ws_url}")
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        # Concurrent requests share a single in-flight connection attempt
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.connect(self.ws_url)
+                logger.info(f"Connected to Playwright at {self.ws_url}")
         return self._browser
 
     async def _handle_health(self, request: web.Request) -> web.Response:
@@ -59,7 +71,19 @@ class ShaydeServer:
             }, status=500)
 
     async def _handle_capture(self, request: web.Request) -> web.Response:
-        """Screenshot capture endpoint."""
+        """Screenshot capture endpoint.
+
+        Mirrors ``CaptureSession.capture``: localhost URLs are rewritten to
+        reach the host from the container (``proxy`` carries the caller's
+        proxy settings), and the device scale factor, extra wait and CSS
+        are applied.
+        """
+        from pathlib import Path
+
+        from shayde.config.schema import ShaydeConfig
+        from shayde.core.capture import capture_screenshot
+        from shayde.core.routes import ROUTE_URL_PATTERN, create_route_handler
+
         try:
             data = await request.json()
             url = data.get("url")
@@ -71,13 +95,26 @@ class ShaydeServer:
             if not url:
                 return web.json_response({"error": "url is required"}, status=400)
 
+            route_config = ShaydeConfig.model_validate({"proxy": data.get("proxy") or {}})
+
             browser = await self._ensure_browser()
-            context = await browser.new_context(viewport=viewport)
+            context = await browser.new_context(
+                viewport=viewport,
+                device_scale_factor=data.get("device_scale_factor", 1),
+            )
             page = await context.new_page()
+            await page.route(ROUTE_URL_PATTERN, create_route_handler(route_config))
 
             try:
-                await page.goto(url, wait_until=wait_until)
-                await page.screenshot(path=output, full_page=full_page)
+                await capture_screenshot(
+                    page,
+                    url,
+                    Path(output),
+                    full_page=full_page,
+                    wait_until=wait_until,
+                    wait_after=data.get("wait_after", 0),
+                    css=data.get("css"),
+                )
             finally:
                 await context.close()
 
@@ -92,6 +129,82 @@ class ShaydeServer:
                 "error": str(e),
             }, status=500)
 
+    async def _handle_session_create(self, request: web.Request) -> web.Response:
+        """Create a step-by-step scenario session."""
+        from pathlib import Path
+
+        from shayde.core.scenario.session_manager import SessionManager
+
+        try:
+            data = await request.json()
+            if not data.get("yaml_path"):
+                return web.json_response({"error": "yaml_path is required"}, status=400)
+
+            output_dir = data.get("output_dir")
+            base_dir = data.get("base_dir")
+            info = await SessionManager.create(
+                yaml_path=Path(data["yaml_path"]),
+                output_dir=Path(output_dir) if output_dir else None,
+                base_url=data.get("base_url"),
+                record_video=data.get("record_video", True),
+                start_part=data.get("start_part", 1),
+                base_dir=Path(base_dir) if base_dir else None,
+                env=data.get("env"),
+            )
+            return web.json_response(info.to_dict())
+        except Exception as e:
+            logger.exception("Session creation failed")
+            return web.json_response({"status": "error", "error": str(e)}, status=500)
+
+    async def _handle_session_list(self, request: web.Request) -> web.Response:
+        """List active sessions."""
+        from shayde.core.scenario.session_manager import SessionManager
+
+        return web.json_response([s.to_dict() for s in SessionManager.list_sessions()])
+
+    async def _handle_session_info(self, request: web.Request) -> web.Response:
+        """Get session details."""
+        from shayde.core.scenario.session_manager import SessionManager
+
+        session_id = request.match_info["session_id"]
+        info = SessionManager.get_session(session_id)
+        if info is None:
+            return web.json_response(
+                {"status": "error", "error": f"Session not found: {session_id}"}, status=404
+            )
+        return web.json_response(info.to_dict())
+
+    async def _handle_session_step(self, request: web.Request) -> web.Response:
+        """Execute the next step of a session."""
+        from shayde.core.scenario.session_manager import SessionManager
+
+        try:
+            data = await request.json() if request.can_read_body else {}
+            result = await SessionManager.execute_next_step(
+                session_id=request.match_info["session_id"],
+                retry=data.get("retry", False),
+                skip=data.get("skip", False),
+            )
+            return web.json_response(result.to_dict())
+        except ValueError as e:
+            return web.json_response({"status": "error", "error": str(e)}, status=400)
+        except Exception as e:
+            logger.exception("Session step failed")
+            return web.json_response({"status": "error", "error": str(e)}, status=500)
+
+    async def _handle_session_end(self, request: web.Request) -> web.Response:
+        """End a session and save its results."""
+        from shayde.core.scenario.session_manager import SessionManager
+
+        try:
+            result = await SessionManager.end(request.match_info["session_id"])
+            return web.json_response(result.to_dict())
+        except ValueError as e:
+            return web.json_response({"status": "error", "error": str(e)}, status=400)
+        except Exception as e:
+            logger.exception("Session end failed")
+            return web.json_response({"status": "error", "error": str(e)}, status=500)
+
     async def _handle_stop(self, request: web.Request) -> web.Response:
         """Stop server endpoint."""
         asyncio.create_task(self._shutdown())
@@ -99,8 +212,11 @@ class ShaydeServer:
 
     async def _shutdown(self) -> None:
         """Graceful shutdown."""
-        await asyncio.sleep(0.5)  # Allow response to be sent
-        if self._runner:
+        await asyncio.sleep(0.1)  # Allow response to be sent
+        if self._stop_event is not None:
+            # Let run_forever() stop everything and exit the process
+            self._stop_event.set()
+        elif self._runner:
             await self._runner.cleanup()
 
     def _create_app(self) -> web.Application:
@@ -108,6 +224,11 @@ class ShaydeServer:
         app = web.Application()
         app.router.add_get("/health", self._handle_health)
         app.router.add_post("/capture", self._handle_capture)
+        app.router.add_post("/sessions", self._handle_session_create)
+        app.router.add_get("/sessions", self._handle_session_list)
+        app.router.add_get("/sessions/{session_id}", self._handle_session_info)
+        app.router.add_post("/sessions/{session_id}/step", self._handle_session_step)
+        app.router.add_post("/sessions/{session_id}/end", self._handle_session_end)
         app.router.add_post("/stop", self._handle_stop)
         return app
 
@@ -122,6 +243,7 @@ class ShaydeServer:
 
         # Write PID file
         PID_FILE.write_text(str(os.getpid()))
+        signal_ready()
 
         logger.info(f"Shayde server started on http://127.0.0.1:{self.port}")
 
@@ -133,6 +255,11 @@ class ShaydeServer:
 
     async def stop(self) -> None:
         """Stop the server."""
+        # Save results of sessions still open (only if any were ever created)
+        session_manager = sys.modules.get("shayde.core.scenario.session_manager")
+        if session_manager is not None:
+            await session_manager.SessionManager.cleanup_all()
+
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -152,11 +279,10 @@ class ShaydeServer:
 
     async def run_forever(self) -> None:
         """Run server until interrupted."""
-        await self.start()
-
-        # Wait for shutdown signal
+        # Set up before start(): a /stop or signal can arrive while start()
+        # is still pre-connecting to the browser
         loop = asyncio.get_event_loop()
-        stop_event = asyncio.Event()
+        stop_event = self._stop_event = asyncio.Event()
 
         def signal_handler():
             stop_event.set()
@@ -164,6 +290,9 @@ class ShaydeServer:
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, signal_handler)
 
+        await self.start()
+
+        # Wait for shutdown signal
         await stop_event.wait()
         await self.stop()
 
@@ -175,23 +304,3 @@ def run_server(ws_url: str = "ws://localhost:3000", port: int = DEFAULT_PORT) ->
         asyncio.run(server.run_forever())
     except KeyboardInterrupt:
         pass
-
-
-def get_pid() -> Optional[int]:
-    """Get server PID if running."""
-    if not PID_FILE.exists():
-        return None
-    try:
-        pid = int(PID_FILE.read_text().strip())
-        # Check if process is running
-        os.kill(pid, 0)
-        return pid
-    except (ValueError, ProcessLookupError, PermissionError):
-        # Clean up stale PID file
-        PID_FILE.unlink(missing_ok=True)
-        return None
-
-
-def is_running() -> bool:
-    """Check if server is running."""
-    return get_pid() is not None
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import socket
-from typing import Any, Dict, Optional
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import aiohttp
 
-from shayde.server.app import DEFAULT_PORT, is_running
+from shayde.server.state import DEFAULT_PORT, server_available
+
+if TYPE_CHECKING:
+    from shayde.core.scenario.models import SessionEndResult, SessionInfo, StepExecutionResult
 
 
 class ShaydeClient:
@@ -17,24 +21,40 @@ class ShaydeClient:
     def __init__(self, port: int = DEFAULT_PORT):
         self.port = port
         self.base_url = f"http://127.0.0.1:{port}"
+        # One keep-alive session per client, created on first request. It is
+        # bound to the event loop it was created on, so a client is used
+        # either from async code or through the *_sync wrappers, not both.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> ShaydeClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            # Let the transports actually close before the loop goes idle
+            await asyncio.sleep(0)
 
     @staticmethod
     def server_available(port: int = DEFAULT_PORT) -> bool:
         """Check if server is available (quick socket check)."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.5)
-            result = sock.connect_ex(("127.0.0.1", port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
+        return server_available(port)
 
     async def health(self) -> Dict[str, Any]:
         """Check server health."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.base_url}/health") as resp:
-                return await resp.json()
+        async with self._get_session().get(f"{self.base_url}/health") as resp:
+            return await resp.json()
 
     async def capture(
         self,
@@ -43,26 +63,128 @@ class ShaydeClient:
         viewport: Optional[Dict[str, int]] = None,
         full_page: bool = False,
         wait_until: str = "networkidle",
+        device_scale_factor: Optional[float] = None,
+        wait_after: int = 0,
+        css: Optional[str] = None,
+        proxy: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Capture screenshot via server."""
-        data = {
+        """Capture screenshot via server.
+
+        ``proxy`` is the caller's proxy config, used for the localhost rewrite.
+        """
+        data: Dict[str, Any] = {
             "url": url,
             "output": output,
             "full_page": full_page,
             "wait_until": wait_until,
+            "wait_after": wait_after,
         }
         if viewport:
             data["viewport"] = viewport
+        if device_scale_factor is not None:
+            data["device_scale_factor"] = device_scale_factor
+        if css:
+            data["css"] = css
+        if proxy is not None:
+            data["proxy"] = proxy
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.base_url}/capture", json=data) as resp:
-                return await resp.json()
+        async with self._get_session().post(f"{self.base_url}/capture", json=data) as resp:
+            return await resp.json()
 
     async def stop(self) -> Dict[str, Any]:
         """Request server to stop."""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.base_url}/stop") as resp:
-                return await resp.json()
+        async with self._get_session().post(f"{self.base_url}/stop") as resp:
+            data = await resp.json()
+        # Don't hold a keep-alive connection open; it delays server shutdown
+        await self.close()
+        return data
+
+    async def create_session(
+        self,
+        yaml_path: Path,
+        output_dir: Optional[Path] = None,
+        base_url: Optional[str] = None,
+        record_video: bool = True,
+        start_part: int = 1,
+        base_dir: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> SessionInfo:
+        """Create a step-by-step session hosted by the server.
+
+        Relative paths are resolved here, since the server may run in
+        another directory; the working directory is sent so the server loads
+        this project's config. For ``${VAR}`` expansion only the variables the
+        scenario references are sent (never the whole environment).
+        """
+        yaml_path = Path(yaml_path).resolve()
+        if env is None:
+            from shayde.core.scenario.parser import load_scenario_yaml, referenced_env_vars
+
+            names = referenced_env_vars(load_scenario_yaml(yaml_path))
+            env = {name: os.environ[name] for name in names if name in os.environ}
+
+        data = {
+            "yaml_path": str(yaml_path),
+            "output_dir": str(Path(output_dir).resolve()) if output_dir else None,
+            "base_url": base_url,
+            "record_video": record_video,
+            "start_part": start_part,
+            "base_dir": str(Path(base_dir or Path.cwd()).resolve()),
+            "env": env,
+        }
+        from shayde.core.scenario.models import SessionInfo
+
+        return SessionInfo.from_dict(await self._session_request("POST", "/sessions", data))
+
+    async def execute_next_step(
+        self, session_id: str, retry: bool = False, skip: bool = False
+    ) -> StepExecutionResult:
+        """Execute the next step of a server-hosted session."""
+        from shayde.core.scenario.models import StepExecutionResult
+
+        data = await self._session_request(
+            "POST", f"/sessions/{session_id}/step", {"retry": retry, "skip": skip}
+        )
+        return StepExecutionResult.from_dict(data)
+
+    async def end_session(self, session_id: str) -> SessionEndResult:
+        """End a server-hosted session."""
+        from shayde.core.scenario.models import SessionEndResult
+
+        data = await self._session_request("POST", f"/sessions/{session_id}/end")
+        return SessionEndResult.from_dict(data)
+
+    async def list_sessions(self) -> list[SessionInfo]:
+        """List sessions hosted by the server."""
+        from shayde.core.scenario.models import SessionInfo
+
+        data = await self._session_request("GET", "/sessions")
+        return [SessionInfo.from_dict(d) for d in data]
+
+    async def get_session(self, session_id: str) -> Optional[SessionInfo]:
+        """Get a server-hosted session, or None if it does not exist."""
+        from shayde.core.scenario.models import SessionInfo
+
+        async with self._get_session().get(f"{self.base_url}/sessions/{session_id}") as resp:
+            if resp.status == 404:
+                return None
+            data = await resp.json()
+        if "error" in data:
+            raise RuntimeError(data["error"])
+        return SessionInfo.from_dict(data)
+
+    async def _session_request(
+        self, method: str, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        # Mirror SessionManager: bad requests raise ValueError, failures RuntimeError
+        async with self._get_session().request(
+            method, f"{self.base_url}{path}", json=data
+        ) as resp:
+            body = await resp.json()
+            if resp.status >= 400:
+                error = body.get("error", resp.reason) if isinstance(body, dict) else resp.reason
+                raise (ValueError if resp.status < 500 else RuntimeError)(error)
+            return body
 
     def capture_sync(
         self,
@@ -73,12 +195,26 @@ class ShaydeClient:
         wait_until: str = "networkidle",
     ) -> Dict[str, Any]:
         """Synchronous capture."""
-        return asyncio.run(self.capture(url, output, viewport, full_page, wait_until))
+        return self._run_sync(self.capture(url, output, viewport, full_page, wait_until))
 
     def health_sync(self) -> Dict[str, Any]:
         """Synchronous health check."""
-        return asyncio.run(self.health())
+        return self._run_sync(self.health())
 
     def stop_sync(self) -> Dict[str, Any]:
         """Synchronous stop."""
-        return asyncio.run(self.stop())
+        return self._run_sync(self.stop())
+
+    def close_sync(self) -> None:
+        """Close the session and the private loop used by the *_sync wrappers."""
+        if self._loop is None:
+            return
+        self._loop.run_until_complete(self.close())
+        self._loop.close()
+        self._loop = None
+
+    def _run_sync(self, coro):
+        # Reuse one loop so the session (and its connection) survives calls
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
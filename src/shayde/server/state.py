@@ -0,0 +1,62 @@
+"""Server process state shared by the server, its client and the CLI.
+
+Kept free of aiohttp/Playwright imports so status checks stay cheap.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_PORT = 9876
+PID_FILE = Path("/tmp/shayde-server.pid")
+SOCKET_FILE = Path("/tmp/shayde-server.sock")
+
+# Environment variable naming a pipe fd the server writes to once listening
+READY_FD_ENV = "SHAYDE_READY_FD"
+
+
+def get_pid() -> Optional[int]:
+    """Get server PID if running."""
+    if not PID_FILE.exists():
+        return None
+    try:
+        pid = int(PID_FILE.read_text().strip())
+        # Check if process is running
+        os.kill(pid, 0)
+        return pid
+    except (ValueError, ProcessLookupError, PermissionError):
+        # Clean up stale PID file
+        PID_FILE.unlink(missing_ok=True)
+        return None
+
+
+def is_running() -> bool:
+    """Check if server is running."""
+    return get_pid() is not None
+
+
+def signal_ready() -> None:
+    """Tell the parent process (if it passed a ready pipe) we're listening."""
+    fd = os.environ.pop(READY_FD_ENV, None)
+    if fd is None:
+        return
+    try:
+        os.write(int(fd), b"1")
+        os.close(int(fd))
+    except (ValueError, OSError):
+        pass
+
+
+def server_available(port: int = DEFAULT_PORT) -> bool:
+    """Check if server is accepting connections (quick socket check)."""
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(0.5)
+        result = sock.connect_ex(("127.0.0.1", port))
+        sock.close()
+        return result == 0
+    except Exception:
+        return False
@@ -0,0 +1,76 @@
+"""Tests for screenshot capture."""
+
+import asyncio
+
+from shayde.core.browser import BrowserManager
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.origin = "http://example.test"
+
+    async def evaluate(self, script):
+        self.context.local_storage.pop(self.origin, None)
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.cookies = []
+        self.local_storage = {}
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def clear_cookies(self):
+        self.cookies.clear()
+
+    async def storage_state(self):
+        return {
+            "cookies": list(self.cookies),
+            "origins": [
+                {"origin": origin, "localStorage": items}
+                for origin, items in self.local_storage.items()
+            ],
+        }
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    async def new_context(self, **options):
+        return FakeContext()
+
+
+def test_pooled_context_state_does_not_leak():
+    """Test a pooled context is reused only after its cookies and storage are cleared."""
+    manager = BrowserManager("ws://unused")
+    manager._browser = FakeBrowser()
+
+    async def scenario():
+        first = await manager.new_page()
+        first.context.cookies.append({"name": "consent", "value": "yes"})
+        first.context.local_storage[first.origin] = [{"name": "ab", "value": "b"}]
+        # A concurrent capture gets its own context
+        other = await manager.new_page()
+        assert other.context is not first.context
+        await manager.release_page(other)
+
+        await manager.release_page(first)
+        second = await manager.new_page()
+        state = await second.context.storage_state()
+        assert state == {"cookies": [], "origins": []}
+
+        # Storage left on another origin: the context is dropped, not reused
+        second.context.local_storage["http://other.test"] = [{"name": "k", "value": "v"}]
+        await manager.release_page(second)
+        assert second.context.closed
+        third = await manager.new_page()
+        assert third.context is not second.context
+
+    asyncio.run(scenario())
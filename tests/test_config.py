@@ -1,10 +1,21 @@
 """Tests for configuration loading."""
 
+import os
+
 import pytest
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from shayde.config.schema import ShaydeConfig, ViewportConfig
-from shayde.config.loader import load_config, get_app_url_from_env, detect_vite_port
+from shayde.config import loader
+from shayde.config.loader import (
+    detect_vite_port,
+    find_config_file,
+    get_app_url_from_env,
+    load_config,
+    load_yaml_file,
+)
 
 
 def test_default_config():
@@ -18,6 +29,15 @@ def test_default_config():
     assert config.viewports["desktop"].width == 1920
 
 
+def test_default_config_is_shared_and_frozen():
+    """Test get_default returns one shared, immutable config."""
+    config = ShaydeConfig.get_default()
+    assert ShaydeConfig.get_default() is config
+
+    with pytest.raises(ValidationError):
+        config.app.base_url = "http://mutated.test"
+
+
 def test_viewport_config():
     """Test viewport configuration."""
     viewport = ViewportConfig(width=375, height=812, device_scale_factor=2)
@@ -54,3 +74,108 @@ def test_config_merge():
     assert config.proxy.port == 8888
     # Other values should be defaults
     assert config.docker.playwright_version == "1.48.0"
+
+
+def test_load_config_cached(tmp_path, monkeypatch):
+    """Test load_config reuses the parsed config until the file changes."""
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / ".shayde.yaml"
+    config_path.write_text("proxy:\n  port: 8888\n")
+
+    first = load_config()
+    assert first.proxy.port == 8888
+    assert load_config() is first
+
+    config_path.write_text("proxy:\n  port: 7777\n")
+    os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1))
+
+    second = load_config()
+    assert second is not first
+    assert second.proxy.port == 7777
+
+    load_config.cache_clear()
+    assert load_config() is not second
+
+
+def test_load_config_rereads_env(temp_project, monkeypatch):
+    """Test a changed APP_URL in .env invalidates the cached config."""
+    monkeypatch.chdir(temp_project)
+    env_file = temp_project / ".env"
+
+    assert load_config().app.base_url == "http://example.test"
+
+    env_file.write_text("APP_URL=http://changed.test\n")
+    os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1))
+    assert load_config().app.base_url == "http://changed.test"
+
+
+def test_load_config_project_dir(temp_project, tmp_path_factory, monkeypatch):
+    """Test config and .env are read from project_dir, not the working directory."""
+    monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+    (temp_project / ".shayde.yaml").write_text("proxy:\n  port: 8888\n")
+
+    config = load_config(project_dir=temp_project)
+    assert config.proxy.port == 8888
+    assert config.app.base_url == "http://example.test"
+
+
+def test_find_config_file_sees_new_files(tmp_path):
+    """Test a config file created after a cached search is found."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    assert find_config_file(sub) != tmp_path / ".shayde.yaml"
+
+    (tmp_path / ".shayde.yaml").write_text("")
+    assert find_config_file(sub) == tmp_path / ".shayde.yaml"
+
+    (sub / "shayde.yaml").write_text("")
+    assert find_config_file(sub) == sub / "shayde.yaml"
+
+
+def test_load_config_cached_explicit_path(tmp_path, monkeypatch):
+    """Test relative and absolute spellings of a config file share a cache entry."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "custom.yaml").write_text("proxy:\n  port: 9999\n")
+
+    config = load_config(Path("custom.yaml"))
+    assert config.proxy.port == 9999
+    assert load_config(tmp_path / "custom.yaml") is config
+
+
+def test_load_yaml_file_cached(tmp_path):
+    """Test YAML files are parsed once until they change."""
+    path = tmp_path / "config.yaml"
+    path.write_text("proxy:\n  port: 8888\n")
+
+    first = load_yaml_file(path)
+    assert load_yaml_file(path) is first
+
+    path.write_text("proxy:\n  port: 7777\n")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+    assert load_yaml_file(path) == {"proxy": {"port": 7777}}
+    assert load_yaml_file(tmp_path / "missing.yaml") == {}
+
+
+def test_load_config_persistent_cache(tmp_path, monkeypatch):
+    """Test the opt-in on-disk cache is reused until a config file changes."""
+    cache_file = tmp_path / "cache" / "config.pkl"
+    monkeypatch.setattr(loader, "CONFIG_CACHE_FILE", cache_file)
+    monkeypatch.setenv(loader.CONFIG_CACHE_ENV, "1")
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / ".shayde.yaml"
+    config_path.write_text("proxy:\n  port: 8888\n")
+    mtime_ns = config_path.stat().st_mtime_ns
+
+    load_config.cache_clear()
+    assert load_config().proxy.port == 8888
+    assert cache_file.exists()
+
+    # Same mtime: a fresh process gets the pickled config without reading YAML
+    config_path.write_text("proxy:\n  port: 7777\n")
+    os.utime(config_path, ns=(0, mtime_ns))
+    load_config.cache_clear()
+    assert load_config().proxy.port == 8888
+
+    os.utime(config_path, ns=(0, mtime_ns + 1))
+    load_config.cache_clear()
+    assert load_config().proxy.port == 7777
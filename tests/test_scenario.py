@@ -0,0 +1,159 @@
+"""Tests for scenario parsing."""
+
+import json
+from pathlib import Path
+
+from shayde.core.scenario import parser as scenario_parser
+from shayde.core.scenario.models import StepStatus
+from shayde.core.scenario.parser import ScenarioParser
+from shayde.core.scenario.reporter import ReportGenerator
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "test-scenario.yaml"
+
+
+def test_parse_uses_yaml_cache(tmp_path, monkeypatch):
+    """Test parsed YAML is cached on disk and invalidated when the file changes."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(scenario_parser, "SCENARIO_CACHE_DIR", cache_dir)
+    scenario_parser._load_scenario_yaml_cached.cache_clear()
+
+    path = tmp_path / "scenario.yaml"
+    path.write_text(FIXTURE.read_text(encoding="utf-8"), encoding="utf-8")
+
+    scenario = ScenarioParser().parse(path)
+    assert scenario.meta.id == "test-auth"
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    # A fresh process would hit the pickle instead of re-parsing
+    scenario_parser._load_scenario_yaml_cached.cache_clear()
+    assert ScenarioParser().parse(path).to_dict() == scenario.to_dict()
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    path.write_text(
+        path.read_text(encoding="utf-8").replace("test-auth", "test-changed"),
+        encoding="utf-8",
+    )
+    assert ScenarioParser().parse(path).meta.id == "test-changed"
+    # The entry for the previous version is replaced, not kept alongside
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+
+def test_report_uses_progress_log_after_crash(tmp_path):
+    """Test results.jsonl is used when results.json was never written."""
+    records = [
+        {
+            "part": 1,
+            "part_title": "Login",
+            "step": {"id": "1-1", "desc": "Open", "status": "passed"},
+        },
+        {
+            "part": 1,
+            "part_title": "Login",
+            "step": {"id": "1-2", "desc": "Submit", "status": "failed"},
+        },
+    ]
+    lines = [
+        json.dumps({"scenario_id": "s1", "title": "Scenario", "started_at": None, **r})
+        for r in records
+    ]
+    # The last line was cut off mid-write
+    (tmp_path / "results.jsonl").write_text("\n".join(lines) + '\n{"scen', encoding="utf-8")
+
+    results = ReportGenerator(tmp_path).load_results()
+    assert results.scenario_id == "s1"
+    assert results.status == StepStatus.FAILED
+    assert [s.step_id for s in results.parts[0].steps] == ["1-1", "1-2"]
+
+
+def test_parse_single_part(tmp_path, monkeypatch):
+    """Test parsing with part= builds only that part and leaves the cache intact."""
+    monkeypatch.setattr(scenario_parser, "SCENARIO_CACHE_DIR", tmp_path)
+
+    full = ScenarioParser().parse(FIXTURE)
+    target = full.steps[-1]
+
+    scenario = ScenarioParser().parse(FIXTURE, part=target.part)
+    assert [p.to_dict() for p in scenario.steps] == [target.to_dict()]
+    assert ScenarioParser().parse(FIXTURE).to_dict() == full.to_dict()
+
+
+def test_session_models_round_trip():
+    """Test session results survive the server's JSON round trip."""
+    from datetime import datetime
+
+    from shayde.core.scenario.models import (
+        SessionEndResult,
+        SessionInfo,
+        StepExecutionResult,
+        StepResult,
+    )
+
+    info = SessionInfo(
+        "s1", "sc", "Title", 2, 5, 1, 0, "admin", "paused", datetime(2024, 1, 2, 3, 4, 5)
+    )
+    step = StepExecutionResult(
+        "s1", "1-1", "Open", 1, "Login",
+        StepResult("1-1", "Open", StepStatus.PASSED, screenshot=Path("a.png"), duration_ms=12),
+        False, False, True, 2, "2-1",
+    )
+    end = SessionEndResult("s1", "passed", 5, 5, 0, 0, 1000, Path("results.json"), None)
+
+    for obj in (info, step, end):
+        data = json.loads(json.dumps(obj.to_dict()))
+        assert type(obj).from_dict(data).to_dict() == obj.to_dict()
+
+
+def test_parse_and_validate_matches_validate(tmp_path, monkeypatch):
+    """Test the single-pass validation reports what validate() does."""
+    monkeypatch.setattr(scenario_parser, "SCENARIO_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "scenario.yaml"
+    path.write_text(
+        "meta: {id: bad, title: ''}\n"
+        "accounts:\n"
+        "  admin: {email: a@example.test, password: secret}\n"
+        "steps:\n"
+        "  - part: 1\n"
+        "    title: One\n"
+        "    account: ghost\n"
+        "    items:\n"
+        "      - {id: '1-1', desc: Login, action: {login: nobody}}\n"
+        "      - {id: '1-1', desc: Duplicate}\n",
+        encoding="utf-8",
+    )
+
+    parser = ScenarioParser()
+    scenario, errors, warnings = parser.parse_and_validate(path)
+    assert errors == ["Duplicate step ID: 1-1"]
+    assert len(warnings) == 3
+    assert parser.validate(scenario) == (False, errors, warnings)
+
+
+def test_create_session_sends_only_referenced_env(tmp_path, monkeypatch):
+    """Test the client forwards only the variables a scenario references."""
+    import asyncio
+
+    from shayde.server.client import ShaydeClient
+
+    monkeypatch.setattr(scenario_parser, "SCENARIO_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setenv("SHAYDE_TEST_PASSWORD", "secret")
+    monkeypatch.setenv("SHAYDE_TEST_UNRELATED", "token")
+    path = tmp_path / "scenario.yaml"
+    path.write_text(
+        "accounts:\n  admin:\n    password: ${SHAYDE_TEST_PASSWORD}\n"
+        "    email: ${SHAYDE_TEST_MISSING}\n",
+        encoding="utf-8",
+    )
+    sent = {}
+
+    async def fake_request(self, method, url_path, data=None):
+        sent.update(data)
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(ShaydeClient, "_session_request", fake_request)
+    try:
+        asyncio.run(ShaydeClient().create_session(path))
+    except RuntimeError:
+        pass
+
+    assert sent["env"] == {"SHAYDE_TEST_PASSWORD": "secret"}